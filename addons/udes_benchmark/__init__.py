@@ -0,0 +1,2 @@
+from . import tools
+from . import tests
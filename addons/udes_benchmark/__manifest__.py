@@ -0,0 +1,22 @@
+{
+    "name": "UDES Benchmark",
+    "summary": "Performance benchmarks for the core UDES warehouse flows",
+    "description": "Generates warehouses of a given size and benchmarks the core UDES flows",
+    "author": "Unipart Digital",
+    "website": "http://github/unipartdigital/udes-open",
+    "category": "UDES",
+    "version": "0.1",
+    "depends": [
+        "udes_common",
+        "udes_get_info",
+        "udes_sale_stock",
+        "udes_stock",
+        "udes_stock_cron",
+        "udes_stock_picking_batch",
+        "udes_stock_refactoring",
+        "udes_stock_routing",
+        "udes_suggest_location",
+    ],
+    "data": [],
+    "demo": [],
+}
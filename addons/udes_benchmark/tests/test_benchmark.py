@@ -0,0 +1,223 @@
+import os
+from unittest import TestCase
+
+from odoo import fields
+from odoo.tests import tagged
+
+from odoo.addons.udes_stock.tests.common import BaseUDES
+from ..tools import Benchmark, BenchmarkScale, WarehouseGenerator
+
+
+class TestBenchmarkBudgets(TestCase):
+    """Tests for checking benchmark results against budgets"""
+
+    def setUp(self):
+        self.scale = BenchmarkScale(2, 2, 1, 1)
+        self.budgets = {
+            "scale": dict(self.scale._asdict()),
+            "flows": {"flow": {"elapsed": 1.0, "count": 10}},
+        }
+
+    def test_scale_from_environ(self):
+        """Unset scale fields default, set ones are read from the environment"""
+        scale = BenchmarkScale.from_environ({"UDES_BENCHMARK_PRODUCTS": "7"})
+        self.assertEqual(scale.products, 7)
+        self.assertEqual(scale.locations, BenchmarkScale.DEFAULT[0])
+
+    def test_within_budget(self):
+        benchmark = Benchmark(None, self.scale, self.budgets)
+        benchmark.results["flow"] = {"elapsed": 0.5, "count": 10, "records": 1}
+        self.assertFalse(benchmark.exceeded("flow"))
+
+    def test_exceeds_budget(self):
+        benchmark = Benchmark(None, self.scale, self.budgets)
+        benchmark.results["flow"] = {"elapsed": 0.5, "count": 11, "records": 1}
+        exceeded = benchmark.exceeded("flow")
+        self.assertEqual(len(exceeded), 1)
+        self.assertIn("count", exceeded[0])
+
+    def test_exceeded_budget_fails(self):
+        """A flow exceeding its budget fails the benchmark test"""
+        test = TestFlowBenchmarks("test_get_info")
+        test.benchmark = Benchmark(None, self.scale, self.budgets)
+        test.benchmark.results["flow"] = {"elapsed": 1.5, "count": 10, "records": 1}
+        with self.assertRaises(AssertionError):
+            test.assertWithinBudget("flow")
+
+    def test_shipped_budgets(self):
+        """The shipped budgets apply at the default scale, and only to benchmarked flows"""
+        scale = BenchmarkScale(*BenchmarkScale.DEFAULT)
+        budgets = Benchmark.load_budgets()
+        self.assertEqual(budgets["scale"], dict(scale._asdict()))
+        self.assertLessEqual(
+            set(budgets["flows"]),
+            {
+                "reserve_stock",
+                "_action_refactor",
+                "get_next_tasks",
+                "drop_off_picked",
+                "suggest_locations",
+                "push_from_drop",
+                "confirm_orders",
+                "get_info",
+            },
+        )
+
+    def test_budgets_from_results(self):
+        """Budgets are made from the results of a run with a margin added"""
+        benchmark = Benchmark(None, self.scale)
+        benchmark.results["flow"] = {"elapsed": 2.0, "count": 95, "records": 1}
+        self.assertEqual(benchmark.budgets_from_results(), {"flow": {"elapsed": 3.0, "count": 105}})
+
+    def test_budgets_ignored_at_other_scales(self):
+        """Budgets are only checked at the scale they were recorded at"""
+        benchmark = Benchmark(None, BenchmarkScale(4, 4, 2, 2), self.budgets)
+        benchmark.results["flow"] = {"elapsed": 5.0, "count": 100, "records": 1}
+        self.assertFalse(benchmark.exceeded("flow"))
+
+
+@tagged("post_install", "-at_install", "-standard", "benchmark")
+class TestFlowBenchmarks(BaseUDES):
+    """Benchmarks of the core flows on a generated warehouse
+
+    Run with ``--test-tags benchmark``.  The scale is taken from the
+    ``UDES_BENCHMARK_<FIELD>`` environment variables, and the results are
+    written as JSON to ``UDES_BENCHMARK_OUTPUT`` if set.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super(TestFlowBenchmarks, cls).setUpClass()
+        cls.scale = BenchmarkScale.from_environ()
+        cls.benchmark = Benchmark(cls.env, cls.scale, Benchmark.load_budgets())
+        cls.generator = WarehouseGenerator(cls.env)
+
+        cls.bench_locations = cls.generator.create_locations(
+            cls.stock_location, cls.scale.locations
+        )
+        cls.bench_products = cls.generator.create_products(cls.scale.products)
+        cls.generator.create_quants(
+            cls.bench_products, cls.bench_locations, cls.scale.pickings * cls.scale.lines
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        output = os.environ.get("UDES_BENCHMARK_OUTPUT")
+        if output:
+            cls.benchmark.write(output)
+        budgets_output = os.environ.get("UDES_BENCHMARK_BUDGETS_OUTPUT")
+        if budgets_output:
+            cls.benchmark.write_budgets(budgets_output)
+        super(TestFlowBenchmarks, cls).tearDownClass()
+
+    def create_bench_pickings(self, picking_type, **kwargs):
+        return self.generator.create_pickings(
+            picking_type, self.bench_products, self.scale.pickings, self.scale.lines, **kwargs
+        )
+
+    def create_bench_batch(self):
+        pickings = self.create_bench_pickings(self.picking_type_pick, assign=True)
+        batch = self.create_batch(user=self.env.user)
+        pickings.write({"batch_id": batch.id})
+        batch.action_confirm()
+        return batch
+
+    def assertWithinBudget(self, flow):
+        exceeded = self.benchmark.exceeded(flow)
+        self.assertFalse(exceeded, "; ".join(exceeded))
+
+    def test_reserve_stock(self):
+        Picking = self.env["stock.picking"]
+
+        self.picking_type_pick.u_num_reservable_pickings = -1
+        pickings = self.create_bench_pickings(self.picking_type_pick)
+        with self.benchmark.measure("reserve_stock", records=len(pickings.move_lines)):
+            Picking.reserve_stock()
+        self.assertWithinBudget("reserve_stock")
+
+    def test_action_refactor(self):
+        self.picking_type_pick.write(
+            {
+                "u_post_assign_action": "group_by_move_line_key",
+                "u_move_line_key_format": "{product_id.default_code}",
+            }
+        )
+        pickings = self.create_bench_pickings(self.picking_type_pick)
+        moves = pickings.move_lines
+        moves._action_assign()
+        with self.benchmark.measure("_action_refactor", records=len(moves)):
+            moves._action_refactor(stage="assign")
+        self.assertWithinBudget("_action_refactor")
+
+    def test_get_next_tasks(self):
+        batch = self.create_bench_batch()
+        with self.benchmark.measure("get_next_tasks", records=len(batch.move_line_ids)):
+            batch.get_next_tasks(limit=False)
+        self.assertWithinBudget("get_next_tasks")
+
+    def test_drop_off_picked(self):
+        batch = self.create_bench_batch()
+        move_lines = batch.move_line_ids
+        for ml in move_lines:
+            ml.qty_done = ml.product_uom_qty
+        with self.benchmark.measure("drop_off_picked", records=len(move_lines)):
+            batch.drop_off_picked(
+                continue_batch=False,
+                move_line_ids=None,
+                location_barcode=self.test_goodsout_location_01.barcode,
+                result_package_name=None,
+            )
+        self.assertWithinBudget("drop_off_picked")
+
+    def test_suggest_locations(self):
+        self.picking_type_goods_in.u_suggest_locations_policy = "by_product"
+        pickings = self.create_bench_pickings(self.picking_type_goods_in, assign=True)
+        move_lines = pickings.move_line_ids
+        with self.benchmark.measure("suggest_locations", records=len(move_lines)):
+            for picking in pickings:
+                picking.move_line_ids.suggest_locations(picking=picking)
+        self.assertWithinBudget("suggest_locations")
+
+    def test_push_from_drop(self):
+        self.push_putaway.u_push_on_drop = False
+        pickings = self.create_bench_pickings(self.picking_type_goods_in, assign=True)
+        for picking in pickings:
+            self.complete_picking(picking)
+        self.push_putaway.u_push_on_drop = True
+        moves = pickings.move_lines
+        with self.benchmark.measure("push_from_drop", records=len(moves)):
+            moves.push_from_drop()
+        self.assertWithinBudget("push_from_drop")
+
+    def test_confirm_orders(self):
+        SaleOrder = self.env["sale.order"]
+        SaleOrderLine = self.env["sale.order.line"]
+
+        partner = self.env.ref("base.partner_admin")
+        now = fields.Datetime.now()
+        orders = SaleOrder.create(
+            [
+                {
+                    "partner_id": partner.id,
+                    "client_order_ref": "BENCH %05d" % i,
+                    "requested_date": now,
+                }
+                for i in range(self.scale.pickings)
+            ]
+        )
+        SaleOrderLine.create(
+            [
+                {"order_id": order.id, "product_id": product.id, "product_uom_qty": 1}
+                for order in orders
+                for product in self.bench_products[: self.scale.lines]
+            ]
+        )
+        with self.benchmark.measure("confirm_orders", records=len(orders.order_line)):
+            orders.confirm_orders()
+        self.assertWithinBudget("confirm_orders")
+
+    def test_get_info(self):
+        pickings = self.create_bench_pickings(self.picking_type_pick, assign=True)
+        with self.benchmark.measure("get_info", records=len(pickings)):
+            pickings.get_info()
+        self.assertWithinBudget("get_info")
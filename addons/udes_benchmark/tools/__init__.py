@@ -0,0 +1,4 @@
+"""Benchmarking tools for UDES"""
+
+from .generator import WarehouseGenerator
+from .benchmark import Benchmark, BenchmarkScale
@@ -0,0 +1,121 @@
+"""Flow benchmarks"""
+
+from collections import namedtuple
+from contextlib import contextmanager
+import json
+import math
+import logging
+import os
+
+from odoo.addons.udes_common.tools import Statistics
+
+_logger = logging.getLogger(__name__)
+
+BUDGETS_FILE = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "budgets.json")
+# Margin added to the recorded results of a run to make budgets, as a fraction of the result
+BUDGET_MARGINS = {"elapsed": 0.5, "count": 0.1}
+
+
+class BenchmarkScale(namedtuple("BenchmarkScale", ("locations", "products", "pickings", "lines"))):
+    """size of a generated warehouse
+
+    - locations: number of stock locations
+    - products: number of products, each with a quant
+    - pickings: number of pickings per picking type
+    - lines: number of moves per picking
+    """
+
+    __slots__ = ()
+
+    DEFAULT = (20, 20, 5, 4)
+
+    @classmethod
+    def from_environ(cls, environ=os.environ):
+        """Scale from UDES_BENCHMARK_<FIELD> environment variables, or the default"""
+        return cls(
+            *(
+                int(environ.get("UDES_BENCHMARK_%s" % field.upper(), default))
+                for field, default in zip(cls._fields, cls.DEFAULT)
+            )
+        )
+
+    def __str__(self):
+        return "/".join("%s=%d" % (field, value) for field, value in zip(self._fields, self))
+
+
+class Benchmark(object):
+    """benchmark of a set of named flows
+
+    The elapsed time and query count of each flow are gathered using
+    :class:`~odoo.addons.udes_common.tools.Statistics`, and may be
+    checked against stored budgets of maximum time and query count.
+    Budgets are stored for a given scale, and are only checked when
+    benchmarking at that same scale.
+    """
+
+    def __init__(self, env, scale, budgets=None):
+        self.env = env
+        self.scale = scale
+        self.budgets = {}
+        if budgets and budgets.get("scale") == dict(scale._asdict()):
+            self.budgets = budgets.get("flows", {})
+        self.results = {}
+
+    @classmethod
+    def load_budgets(cls, path=None):
+        """Load budgets from a JSON file, by default the budgets shipped with the module"""
+        with open(path or os.environ.get("UDES_BENCHMARK_BUDGETS", BUDGETS_FILE)) as f:
+            return json.load(f)
+
+    @contextmanager
+    def measure(self, flow, records=None):
+        """Measure a flow, optionally noting the number of records it acts on"""
+        self.env.flush()
+        with Statistics(self.env) as stats:
+            yield stats
+            self.env.flush()
+        self.results[flow] = {
+            "elapsed": stats.elapsed,
+            "count": stats.count,
+            "records": records,
+        }
+        _logger.info(
+            "Benchmark %s at %s: %.3fs, %d queries", flow, self.scale, stats.elapsed, stats.count
+        )
+
+    def exceeded(self, flow):
+        """Return a list of descriptions of the budgets exceeded by a flow"""
+        result = self.results[flow]
+        budget = self.budgets.get(flow, {})
+        return [
+            "%s %s of %s exceeds budget of %s" % (flow, key, result[key], budget[key])
+            for key in ("elapsed", "count")
+            if key in budget and result[key] > budget[key]
+        ]
+
+    def budgets_from_results(self):
+        """Return budgets of the results, with BUDGET_MARGINS added"""
+        return {
+            flow: {
+                "elapsed": round(result["elapsed"] * (1 + BUDGET_MARGINS["elapsed"]), 3),
+                "count": math.ceil(result["count"] * (1 + BUDGET_MARGINS["count"])),
+            }
+            for flow, result in self.results.items()
+        }
+
+    def write(self, path):
+        """Write the results as JSON"""
+        self._write_flows(path, self.results)
+
+    def write_budgets(self, path):
+        """Write budgets of the results as JSON, in the format of the budget file"""
+        self._write_flows(path, self.budgets_from_results())
+
+    def _write_flows(self, path, flows):
+        with open(path, "w") as f:
+            json.dump(
+                {"scale": dict(self.scale._asdict()), "flows": flows},
+                f,
+                indent=2,
+                sort_keys=True,
+            )
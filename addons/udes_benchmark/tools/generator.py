@@ -0,0 +1,96 @@
+"""Synthetic warehouse data"""
+
+from datetime import timedelta
+from itertools import cycle, islice
+
+from odoo import fields
+
+
+class WarehouseGenerator(object):
+    """synthetic warehouse data generator
+
+    Creates locations, products, quants and pickings in bulk, with
+    names and barcodes prefixed by ``prefix`` so generated data can be
+    told apart from anything else in the database.
+    """
+
+    def __init__(self, env, prefix="BENCH"):
+        self.env = env
+        self.prefix = prefix
+
+    def create_locations(self, parent, count, **kwargs):
+        """Create and return count internal locations under parent"""
+        Location = self.env["stock.location"]
+        vals = {"location_id": parent.id, "usage": "internal"}
+        vals.update(kwargs)
+        return Location.create(
+            [
+                dict(
+                    vals,
+                    name="%s %s %05d" % (self.prefix, parent.name, i),
+                    barcode="L%s%s%05d" % (self.prefix, parent.id, i),
+                )
+                for i in range(count)
+            ]
+        )
+
+    def create_products(self, count, **kwargs):
+        """Create and return count stockable products"""
+        Product = self.env["product.product"]
+        vals = {"type": "product"}
+        vals.update(kwargs)
+        return Product.create(
+            [
+                dict(
+                    vals,
+                    name="%s product %05d" % (self.prefix, i),
+                    barcode="%sproduct%05d" % (self.prefix, i),
+                    default_code="%sref%05d" % (self.prefix, i),
+                )
+                for i in range(count)
+            ]
+        )
+
+    def create_quants(self, products, locations, qty, quants_per_product=1):
+        """
+        Create and return quants of qty for each product, spread over locations
+        in a round robin, with quants_per_product quants for each product.
+        """
+        Quant = self.env["stock.quant"]
+        now = fields.Datetime.now()
+        location_ids = cycle(locations.ids)
+        vals_list = []
+        for product in products:
+            for location_id in islice(location_ids, quants_per_product):
+                vals_list.append(
+                    {
+                        "product_id": product.id,
+                        "location_id": location_id,
+                        "quantity": qty,
+                        # Reserve quants in order of creation
+                        "in_date": now + timedelta(seconds=len(vals_list)),
+                    }
+                )
+        return Quant.create(vals_list)
+
+    def create_pickings(
+        self, picking_type, products, count, lines_per_picking, qty=1, confirm=True, assign=False
+    ):
+        """
+        Create and return count pickings of picking_type, with lines_per_picking
+        moves of qty each, cycling through products.
+        """
+        Picking = self.env["stock.picking"]
+        pickings = Picking.browse()
+        product_cycle = cycle(products)
+        for _i in range(count):
+            products_info = [
+                {"product": product, "uom_qty": qty}
+                for product in islice(product_cycle, lines_per_picking)
+            ]
+            pickings |= Picking.create_picking(
+                picking_type, products_info=products_info, confirm=confirm
+            )
+        if assign:
+            pickings.action_assign()
+        return pickings
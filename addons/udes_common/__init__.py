@@ -1,5 +1,6 @@
 from . import registry
 from . import models
+from . import controllers
 from . import tools
 from . import tests
 from . import exceptions
@@ -0,0 +1,12 @@
+from odoo import http
+from odoo.http import request
+
+
+class Metrics(http.Controller):
+    @http.route("/udes/metrics", type="http", auth="user", methods=["GET"])
+    def metrics(self):
+        """Expose the metrics of the profiled operations for Prometheus to scrape"""
+        text = request.env["udes.metrics"].get_metrics_text()
+        return request.make_response(
+            text, headers=[("Content-Type", "text/plain; version=0.0.4; charset=utf-8")]
+        )
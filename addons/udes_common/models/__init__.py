@@ -2,4 +2,5 @@ from . import ir_module
 from . import res_users
 from . import models
 from . import fields
+from . import udes_metrics
 from .models import add_if_not_exists
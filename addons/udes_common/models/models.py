@@ -8,8 +8,10 @@ from .. import tools
 
 from odoo import models, api, _
 from odoo.exceptions import ValidationError, UserError
+from odoo.osv import expression
 from lxml import etree
 from odoo.tools import DEFAULT_SERVER_DATE_FORMAT as DATE_FORMAT
+from odoo.tools import ormcache
 from datetime import datetime
 
 _logger = logging.getLogger(__name__)
@@ -44,6 +46,77 @@ def batched(self, size=models.PREFETCH_MAX):
     return tools.ranged(self.sliced(size=size))
 
 
+def _prefetch_paths(recs, paths):
+    """Read the (possibly dotted) field paths of ``recs`` into the cache
+
+    Returns all the records read, including related records.
+    """
+    read = [recs]
+    by_field = {}
+    for path in paths:
+        name, _dot, rest = path.partition(".")
+        by_field.setdefault(name, [])
+        if rest:
+            by_field[name].append(rest)
+    recs.read(list(by_field), load="_classic_write")
+    for name, rests in by_field.items():
+        if rests:
+            read.extend(_prefetch_paths(recs.mapped(name), rests))
+    return read
+
+
+def _search_pages(recs, domain, batch_size, order):
+    """Yield pages of up to ``batch_size`` records matching ``domain``
+
+    Pages in order of id are searched in turn, each search starting after
+    the last id of the previous page.  Pages in any other order are taken
+    from the ids of all the matching records, searched once in that order.
+    """
+    if order and order != "id":
+        ids = recs.search(domain, order=order).ids
+        for index in range(0, len(ids), batch_size):
+            # Skip records deleted since the ids were searched
+            page = recs.browse(ids[index : index + batch_size]).exists()
+            if page:
+                yield page
+        return
+    last_id = 0
+    while True:
+        page_domain = expression.AND([domain, [("id", ">", last_id)]])
+        page = recs.search(page_domain, order="id", limit=batch_size)
+        if not page:
+            break
+        last_id = page.ids[-1]
+        yield page
+
+
+@add_if_not_exists(models.BaseModel)
+def search_iter(self, domain, batch_size=models.PREFETCH_MAX, fields=None, order=None):
+    """Search for records matching ``domain`` and yield them in pages
+
+    By default pages of up to ``batch_size`` records are searched in
+    order of id, each search starting after the last id of the previous
+    page, so records created or deleted while iterating do not shift the
+    pages.  If ``order`` is set, the ids of the matching records are
+    searched once in that order and split into pages, so records created
+    while iterating are not included.
+    If ``fields`` is set, only those fields are read for each page,
+    which may include dotted paths to fields of related records.
+
+    The records of each page (and any related records read through
+    ``fields``) are evicted from the cache once the next page is
+    requested, so memory use does not grow with the number of records.
+    """
+    for page in _search_pages(self, domain, batch_size, order):
+        cached = _prefetch_paths(page, fields) if fields else [page]
+        try:
+            yield page
+        finally:
+            for records in cached:
+                records.flush(records=records)
+                records.invalidate_cache(ids=records.ids)
+
+
 def getter(key):
     func = None
     for x in key.split("."):
@@ -55,12 +128,18 @@ def getter(key):
 
 
 @add_if_not_exists(models.BaseModel)
-def groupby(self, key, sort=True):
+def groupby(self, key, sort=True, bucket=False):
     """Return the recordset ``self`` grouped by ``key``
 
     The recordset will automatically be sorted using ``key`` as the
     sorting key, unless ``sort`` is explicitly set to ``False``.
 
+    If ``bucket`` is set, the records are instead put into buckets by
+    ``key`` in a single pass, without sorting the recordset.  Every record
+    with the same key ends up in the same group.  The groups are sorted by
+    key as above, unless ``sort`` is set to ``False``, in which case they
+    are in the order their key is first seen.
+
     ``key`` is permitted to produce a singleton recordset object, in
     which case the sort order will be well-defined but arbitrary.  If
     a non-arbitrary ordering is required, then use :meth:`~.sorted` to
@@ -93,9 +172,23 @@ def groupby(self, key, sort=True):
             temp_key.append(next_key)
         return tuple(temp_key)
 
+    def sort_key(value):
+        """Return a sortable equivalent of the key value"""
+        if isinstance(value, models.BaseModel):
+            return value.ids
+        if isinstance(value, tuple) and tuple_contains_recordset(value):
+            return get_ids_from_recordset_in_tuple(value)
+        return value
+
     recs = self
     if isinstance(key, str):
         key = itemgetter(key)
+    if bucket:
+        buckets = {}
+        for rec in recs:
+            buckets.setdefault(key(rec), []).append(rec.id)
+        keys = sorted(buckets, key=sort_key) if sort else buckets
+        return ((k, self.browse(buckets[k]).with_prefetch(self._prefetch_ids)) for k in keys)
     if sort:
         if recs:
             first_key = key(next(iter(recs)))
@@ -115,9 +208,11 @@ def statistics(self, cache=False):
 
 
 @add_if_not_exists(models.BaseModel)
-def trace(self, filter=None, max=None):
+def trace(self, filter=None, max=None, aggregate=False, threshold=1):
     """Trace database queries"""
-    return tools.QueryTracer(self.env.cr, filter=filter, max=max)
+    return tools.QueryTracer(
+        self.env.cr, filter=filter, max=max, aggregate=aggregate, threshold=threshold
+    )
 
 
 @add_if_not_exists(models.BaseModel)
@@ -147,25 +242,55 @@ class Base(models.AbstractModel):
     # specific models.
     DetailedFormViewFields = []
 
+    # Names of the date and datetime fields checked by validate_values_of_date_fields,
+    # set for each model on registry setup
+    _validated_date_fields = frozenset()
+
+    @api.model
+    def _setup_complete(self):
+        """Precompute the date and datetime fields of the model to be validated on write"""
+        super()._setup_complete()
+        type(self)._validated_date_fields = frozenset(
+            name
+            for name, field in self._fields.items()
+            if field.type in ("date", "datetime") and name not in ("write_date", "create_date")
+        )
+
     @api.model
     def fields_view_get(self, view_id=None, view_type="form", toolbar=False, submenu=False):
         """Override fields_view_get to remove/hide information that is specified in models"""
         res = super().fields_view_get(view_id, view_type, toolbar, submenu)
-        doc = etree.XML(res["arch"])
-        if self._context.get("view_all_fields"):
+        view_all_fields = bool(self._context.get("view_all_fields"))
+        if view_all_fields:
+            arch = res["arch"]
+            marker = "action_detailed_view" if isinstance(arch, str) else b"action_detailed_view"
+            if marker not in arch:
+                return res
+        elif not self.DetailedFormViewFields or view_type != "form":
+            return res
+        res["arch"] = self._get_detailed_view_arch(res["arch"], view_type, view_all_fields)
+        return res
+
+    @api.model
+    @ormcache("self._name", "arch", "view_type", "view_all_fields")
+    def _get_detailed_view_arch(self, arch, view_type, view_all_fields):
+        """
+        Return the arch with the view more button removed if view_all_fields is set,
+        otherwise with the DetailedFormViewFields removed from form views.
+
+        The processed arch is cached on the original arch, so views are only parsed
+        and serialised again once they change or the registry caches are cleared.
+        """
+        doc = etree.XML(arch)
+        if view_all_fields:
             # Hide the view more button
-            doc = etree.XML(res["arch"])
             for node in doc.xpath("//button[@name='action_detailed_view']"):
                 node.getparent().remove(node)
-        else:
-            if not self.DetailedFormViewFields:
-                return res
-            if view_type == "form":
-                for field_name in self.DetailedFormViewFields:
-                    for node in doc.xpath("//field[@name='%s']" % field_name):
-                        node.getparent().remove(node)
-        res["arch"] = etree.tostring(doc)
-        return res
+        elif view_type == "form":
+            for field_name in self.DetailedFormViewFields:
+                for node in doc.xpath("//field[@name='%s']" % field_name):
+                    node.getparent().remove(node)
+        return etree.tostring(doc)
 
     def base_model_detailed_view(self, model, form_view):
         """Main method which can be called from all models to redirect to a form view with context
@@ -190,9 +315,12 @@ class Base(models.AbstractModel):
 
          On Core _create method vals are expected to be a list
         """
-        for val in vals:
-            if isinstance(val.get("stored"), dict):
-                self.validate_values_of_date_fields(val.get("stored"))
+        date_fields = self._validated_date_fields
+        if date_fields:
+            for val in vals:
+                stored = val.get("stored")
+                if isinstance(stored, dict) and not date_fields.isdisjoint(stored):
+                    self.validate_values_of_date_fields(stored)
         res = super()._create(vals)
         return res
 
@@ -200,7 +328,7 @@ class Base(models.AbstractModel):
         """Inheriting low level _write method to check if there is any date or datetime field less
         than a static year 1000. In that case raise an error to show the users that the date entered
          is not correct"""
-        if isinstance(vals, dict):
+        if isinstance(vals, dict) and not self._validated_date_fields.isdisjoint(vals):
             self.validate_values_of_date_fields(vals)
         res = super()._write(vals)
         return res
@@ -212,15 +340,11 @@ class Base(models.AbstractModel):
         can be converted to a date field and the year is greater than 1000.
         Raising error in case year is less than 1000
         """
-        date_fields = {
-            key: value
-            for key, value in self._fields.items()
-            if value.type in ("date", "datetime") and key not in ("write_date", "create_date")
-        }
-        date_values = {
-            k: v for k, v in values.items() if k in date_fields and isinstance(v, str) and v
-        }
-        for date_value in date_values.values():
+        date_fields = self._validated_date_fields
+        date_values = [
+            v for k, v in values.items() if k in date_fields and isinstance(v, str) and v
+        ]
+        for date_value in date_values:
             try:
                 date_field = datetime.strptime(date_value[:10], DATE_FORMAT)
             except:
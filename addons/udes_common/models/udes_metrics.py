@@ -0,0 +1,46 @@
+from odoo import models, api, _
+from odoo.exceptions import AccessError
+
+from ..tools import METRICS_REGISTRY, retry_counters
+
+
+class UdesMetrics(models.AbstractModel):
+    _name = "udes.metrics"
+    _description = "UDES Operation Metrics"
+
+    def _check_metrics_access(self):
+        """Only administrators may see or reset the metrics"""
+        if not self.env.is_admin():
+            raise AccessError(_("Only administrators can access operation metrics"))
+
+    @api.model
+    def get_metrics(self):
+        """
+        Returns the metrics of the profiled operations in this process,
+        as a dictionary of call count, errors, elapsed time, query count
+        and elapsed time percentiles by operation name.
+        """
+        self._check_metrics_access()
+        return METRICS_REGISTRY.summary()
+
+    @api.model
+    def get_metrics_text(self):
+        """Returns the metrics of the profiled operations in the Prometheus text format"""
+        self._check_metrics_access()
+        return METRICS_REGISTRY.prometheus()
+
+    @api.model
+    def get_retry_counters(self):
+        """
+        Returns the counters of calls, retries, successes after retrying and
+        give ups of the operations retried on concurrency failures in this process.
+        """
+        self._check_metrics_access()
+        return retry_counters()
+
+    @api.model
+    def reset_metrics(self):
+        """Discards the metrics of the profiled operations in this process"""
+        self._check_metrics_access()
+        METRICS_REGISTRY.reset()
+        return True
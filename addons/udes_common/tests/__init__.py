@@ -5,3 +5,7 @@ from . import test_selection_display_name
 from . import test_prevent_bad_dates
 from . import test_record_is_child_of_self
 from . import test_fields
+from . import test_metrics
+from . import test_tracing
+from . import test_retry
+from . import test_search_iter
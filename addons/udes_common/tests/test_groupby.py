@@ -1,5 +1,7 @@
 """Groupby tests"""
 
+from odoo.exceptions import MissingError
+
 from .common import CommonBase
 
 
@@ -120,3 +122,51 @@ class TestGroupby(CommonBase):
                     f"Company {company.name} & (Title {title.name} & Category: {category.name}) "
                     f"should have returned: {expected_contacts}, got: {contacts}",
                 )
+
+    def test_groupby_bucket_field_name(self):
+        """
+        Assert that contacts bucketed by a field name (`parent_id`) without sorting are grouped
+        correctly, in the order each company is first seen
+        """
+        contacts = self.company_c_contacts | self.company_a_contacts | self.company_b_contacts
+
+        grouped = list(contacts.groupby("parent_id", sort=False, bucket=True))
+
+        self.assertEqual(
+            [company for company, _contacts in grouped],
+            [self.company_c, self.company_a, self.company_b],
+        )
+        for company, company_contacts in grouped:
+            with self.subTest(company=company):
+                self.assertEqual(company_contacts, company.child_ids)
+
+    def test_groupby_bucket_callable(self):
+        """
+        Assert that contacts bucketed by a callable (`parent_id`, `title`) are grouped
+        the same as when sorted
+        """
+        key = lambda c: (c.parent_id, c.title)
+        expected = dict(self.all_contacts.groupby(key))
+
+        grouped = dict(self.all_contacts.groupby(key, bucket=True))
+
+        self.assertEqual(grouped, expected)
+
+    def test_groupby_bucket_sorted(self):
+        """
+        Assert that contacts bucketed by `parent_id` are returned in the same group order
+        as when sorted
+        """
+        contacts = self.company_c_contacts | self.company_a_contacts | self.company_b_contacts
+
+        grouped = list(contacts.groupby("parent_id", bucket=True))
+
+        self.assertEqual(grouped, list(contacts.groupby("parent_id")))
+
+    def test_groupby_bucket_missing_record(self):
+        """Assert that bucketing a deleted contact raises rather than dropping it"""
+        contacts = self.company_a_contacts
+        contacts[0].unlink()
+
+        with self.assertRaises(MissingError):
+            list(contacts.groupby("parent_id", bucket=True))
@@ -0,0 +1,59 @@
+"""Operation metrics tests"""
+
+from .common import CommonBase
+from ..tools import MetricsRegistry, profiled
+
+
+class TestMetrics(CommonBase):
+    """Tests for the metrics registry and profiled decorator"""
+
+    def setUp(self):
+        super().setUp()
+        self.registry = MetricsRegistry(window=10)
+
+    def test_records_calls(self):
+        """Check calls, queries and percentiles are recorded by operation"""
+        for elapsed in range(1, 11):
+            self.registry.record("test.operation", float(elapsed), 2)
+        self.registry.record("test.failing", 1.0, 0, error=True)
+
+        summary = self.registry.summary()
+        self.assertEqual(list(summary), ["test.failing", "test.operation"])
+        operation = summary["test.operation"]
+        self.assertEqual(operation["calls"], 10)
+        self.assertEqual(operation["errors"], 0)
+        self.assertEqual(operation["elapsed"], 55.0)
+        self.assertEqual(operation["count"], 20)
+        self.assertEqual(operation["p50"], 5.0)
+        self.assertEqual(operation["p95"], 10.0)
+        self.assertEqual(operation["p99"], 10.0)
+        self.assertEqual(summary["test.failing"]["errors"], 1)
+
+    def test_profiled(self):
+        """Check a profiled method records its queries, including when it fails"""
+        Partner = self.env["res.partner"]
+
+        @profiled("res.partner.search", registry=self.registry)
+        def search(model, fail=False):
+            model.search([], limit=1)
+            if fail:
+                raise ValueError("Failed")
+            return True
+
+        self.assertTrue(search(Partner))
+        with self.assertRaises(ValueError):
+            search(Partner, fail=True)
+
+        operation = self.registry.summary()["res.partner.search"]
+        self.assertEqual(operation["calls"], 2)
+        self.assertEqual(operation["errors"], 1)
+        self.assertGreaterEqual(operation["count"], 2)
+
+    def test_prometheus(self):
+        """Check metrics are exported in the Prometheus text format"""
+        self.registry.record("test.operation", 0.5, 3)
+        text = self.registry.prometheus()
+        self.assertIn('udes_operation_seconds{operation="test.operation",quantile="0.5"} 0.5', text)
+        self.assertIn('udes_operation_seconds_count{operation="test.operation"} 1', text)
+        self.assertIn('udes_operation_queries_total{operation="test.operation"} 3', text)
+        self.assertIn("# TYPE udes_operation_seconds summary", text)
@@ -1,5 +1,7 @@
 """Tests for preventing invalid dates on backend"""
 
+from unittest.mock import patch
+
 from odoo.exceptions import UserError
 from odoo.tests import common, tagged
 
@@ -52,3 +54,29 @@ class TestPreventBadDates(common.SavepointCase):
                     date="0980-01-02",
                 )
             )
+
+    def test_validated_date_fields_precomputed(self):
+        """Test that the date fields to validate are precomputed for each model,
+        excluding the create and write dates"""
+        ResPartner = self.env["res.partner"]
+
+        self.assertIn("date", ResPartner._validated_date_fields)
+        self.assertNotIn("name", ResPartner._validated_date_fields)
+        self.assertNotIn("write_date", ResPartner._validated_date_fields)
+        self.assertNotIn("create_date", ResPartner._validated_date_fields)
+
+    def test_writes_without_dates_are_not_validated(self):
+        """Test that dates are only validated when writing a date field"""
+        ResPartner = self.env["res.partner"]
+        partner = ResPartner.create(dict(name="Partner Test 4"))
+
+        with patch.object(
+            type(ResPartner), "validate_values_of_date_fields", autospec=True
+        ) as validate:
+            partner.write(dict(name="Partner Test 5"))
+            partner.flush()
+            validate.assert_not_called()
+
+            partner.write(dict(date="1001-01-01"))
+            partner.flush()
+            validate.assert_called()
@@ -0,0 +1,47 @@
+"""Tests for retry policies"""
+
+import time
+from unittest import TestCase
+
+from ..tools import RetryPolicy, retry_counters
+
+
+class TestRetryPolicy(TestCase):
+    """Tests for RetryPolicy"""
+
+    def test01_exponential_backoff(self):
+        """Check the delay doubles for every retry, up to the maximum delay"""
+        policy = RetryPolicy("test.backoff", base_delay=0.1, max_delay=0.5, jitter=False)
+        self.assertEqual(
+            [round(policy.backoff(tries), 3) for tries in range(1, 6)], [0.1, 0.2, 0.4, 0.5, 0.5]
+        )
+
+    def test02_jitter(self):
+        """Check the delay with jitter is at most the exponential delay"""
+        policy = RetryPolicy("test.jitter", base_delay=0.1, max_delay=0.5)
+        for tries in range(1, 6):
+            with self.subTest(tries=tries):
+                self.assertLessEqual(policy.backoff(tries), min(0.1 * 2 ** (tries - 1), 0.5))
+
+    def test03_gives_up(self):
+        """Check retries are given up after max_tries or beyond max_elapsed"""
+        policy = RetryPolicy("test.give_up", max_tries=2, max_elapsed=10)
+        started = time.monotonic()
+        self.assertIsNotNone(policy.next_wait(1, started))
+        self.assertIsNotNone(policy.next_wait(2, started))
+        self.assertIsNone(policy.next_wait(3, started))
+        self.assertIsNone(policy.next_wait(1, started - 10))
+
+    def test04_counters(self):
+        """Check calls, retries, successes after retrying and give ups are counted"""
+        policy = RetryPolicy("test.counters", max_tries=1)
+        started = time.monotonic()
+        policy.succeeded(0)
+        policy.next_wait(1, started)
+        policy.succeeded(1)
+        policy.next_wait(1, started)
+        policy.next_wait(2, started)
+        self.assertEqual(
+            retry_counters()["test.counters"],
+            {"calls": 3, "retries": 2, "retried_successes": 1, "give_ups": 1},
+        )
@@ -0,0 +1,53 @@
+"""Tests for search_iter"""
+
+from .common import CommonBase
+
+
+class TestSearchIter(CommonBase):
+    """Tests for search_iter method on BaseModel"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.category = cls.create_partner_category("Search Iter")
+        cls.partners = cls.env["res.partner"].browse()
+        for i in range(5):
+            cls.partners |= cls.create_partner(
+                "Search Iter %d" % i, category_id=[(6, 0, cls.category.ids)]
+            )
+        cls.domain = [("category_id", "in", cls.category.ids)]
+
+    def test_pages_in_order_of_id(self):
+        """Assert that all records are yielded in pages of batch_size in order of id"""
+        Partner = self.env["res.partner"]
+        pages = list(Partner.search_iter(self.domain, batch_size=2))
+        self.assertEqual([len(page) for page in pages], [2, 2, 1])
+        self.assertEqual([x for page in pages for x in page.ids], sorted(self.partners.ids))
+
+    def test_pages_in_given_order(self):
+        """Assert that all records are yielded in pages of batch_size in the given order"""
+        Partner = self.env["res.partner"]
+        pages = list(Partner.search_iter(self.domain, batch_size=2, order="id desc"))
+        self.assertEqual([len(page) for page in pages], [2, 2, 1])
+        self.assertEqual(
+            [x for page in pages for x in page.ids], sorted(self.partners.ids, reverse=True)
+        )
+
+    def test_records_deleted_while_iterating(self):
+        """Assert that deleting records while iterating does not skip any records"""
+        Partner = self.env["res.partner"]
+        seen = Partner.browse()
+        for page in Partner.search_iter(self.domain, batch_size=2):
+            seen |= page
+            page.unlink()
+        self.assertEqual(seen, self.partners)
+
+    def test_evicts_previous_page(self):
+        """Assert that the fields read for a page are evicted once the next page is requested"""
+        Partner = self.env["res.partner"]
+        name_field = Partner._fields["name"]
+        pages = Partner.search_iter(self.domain, batch_size=2, fields=["name", "category_id.name"])
+        first_page = next(pages)
+        self.assertTrue(all(self.env.cache.contains(p, name_field) for p in first_page))
+        next(pages)
+        self.assertFalse(any(self.env.cache.contains(p, name_field) for p in first_page))
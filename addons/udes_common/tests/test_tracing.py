@@ -0,0 +1,44 @@
+"""Query tracing tests"""
+
+from .common import CommonBase
+from ..tools.tracing import normalise_query
+
+
+class TestQueryTracerAggregate(CommonBase):
+    """Tests for the aggregating mode of the query tracer"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.partners = cls.create_partner("Alice") | cls.create_partner("Bob")
+        cls.partners |= cls.create_partner("Carol")
+
+    def test_normalise_query(self):
+        """Check literals and lists of parameters are normalised"""
+        self.assertEqual(
+            normalise_query("SELECT id FROM t WHERE id IN (1, 2, 3) AND name = 'it''s'  LIMIT 1"),
+            "SELECT id FROM t WHERE id IN (?) AND name = ? LIMIT ?",
+        )
+        self.assertEqual(
+            normalise_query("SELECT id FROM t WHERE id IN (%s, %s) AND a = %(a)s"),
+            "SELECT id FROM t WHERE id IN (?) AND a = ?",
+        )
+
+    def test_reports_repeated_queries(self):
+        """Check a search per record is reported as a repeated query"""
+        Partner = self.env["res.partner"]
+        with Partner.trace(filter=Partner, aggregate=True) as tracer:
+            for partner in self.partners:
+                Partner.search([("id", "=", partner.id)])
+        report = tracer.report()
+        self.assertEqual(len(report), 1)
+        self.assertEqual(report[0].count, 3)
+        self.assertIn("test_reports_repeated_queries", report[0].caller)
+        self.assertFalse(tracer.report(threshold=3))
+
+    def test_no_repeated_queries(self):
+        """Check a single search for all records is not reported"""
+        Partner = self.env["res.partner"]
+        with Partner.trace(filter=Partner, aggregate=True) as tracer:
+            Partner.search([("id", "in", self.partners.ids)])
+        self.assertFalse(tracer.report())
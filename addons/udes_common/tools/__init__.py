@@ -2,6 +2,8 @@
 
 from .iterators import batched, ranged, sliced
 from .statistics import Statistics
+from .metrics import METRICS_REGISTRY, MetricsRegistry, profiled
 from .tracing import QueryTracer
 from .relational_field_operators import RelationalFieldOperators as RelFieldOps
 from .retry import odoo_retry as odoo_retry
+from .retry import RetryPolicy, retry_counters
@@ -0,0 +1,140 @@
+"""Operation metrics"""
+
+from collections import deque
+from functools import wraps
+import math
+import threading
+
+from .statistics import Statistics
+
+
+class OperationMetrics(object):
+    """metrics for a single named operation
+
+    Totals are kept over the lifetime of the process, while percentiles
+    are calculated from a bounded window of the most recent samples.
+    """
+
+    QUANTILES = (0.5, 0.95, 0.99)
+
+    def __init__(self, name, window=1000):
+        self.name = name
+        self.calls = 0
+        self.errors = 0
+        self.elapsed = 0.0
+        self.count = 0
+        self.samples = deque(maxlen=window)
+
+    def record(self, elapsed, count, error=False):
+        """Record a single call of the operation"""
+        self.calls += 1
+        self.errors += bool(error)
+        self.elapsed += elapsed
+        self.count += count
+        self.samples.append(elapsed)
+
+    def quantile(self, q):
+        """Elapsed time quantile of the recent samples (nearest rank)"""
+        if not self.samples:
+            return 0.0
+        samples = sorted(self.samples)
+        rank = max(math.ceil(q * len(samples)), 1)
+        return samples[rank - 1]
+
+    def summary(self):
+        """Summary of the metrics as a dictionary"""
+        summary = {
+            "calls": self.calls,
+            "errors": self.errors,
+            "elapsed": self.elapsed,
+            "count": self.count,
+        }
+        summary.update(("p%d" % round(q * 100), self.quantile(q)) for q in self.QUANTILES)
+        return summary
+
+
+class MetricsRegistry(object):
+    """process-wide registry of operation metrics
+
+    Operations are identified by name, and record their call count,
+    elapsed time and query count.  Metrics are held in memory for the
+    lifetime of the process: each worker process has its own registry.
+    """
+
+    def __init__(self, window=1000):
+        self.window = window
+        self.lock = threading.Lock()
+        self.operations = {}
+
+    def record(self, name, elapsed, count, error=False):
+        """Record a single call of a named operation"""
+        with self.lock:
+            operation = self.operations.get(name)
+            if operation is None:
+                operation = self.operations[name] = OperationMetrics(name, window=self.window)
+            operation.record(elapsed, count, error=error)
+
+    def reset(self):
+        """Discard all recorded metrics"""
+        with self.lock:
+            self.operations.clear()
+
+    def summary(self):
+        """Summary of the metrics of all operations, by name"""
+        with self.lock:
+            return {name: op.summary() for name, op in sorted(self.operations.items())}
+
+    def prometheus(self, prefix="udes_operation"):
+        """Metrics of all operations in the Prometheus text exposition format"""
+        summary = self.summary()
+        lines = []
+
+        def family(metric, kind, help, key, quantiles=False):
+            lines.append("# HELP %s_%s %s" % (prefix, metric, help))
+            lines.append("# TYPE %s_%s %s" % (prefix, metric, kind))
+            for name, values in summary.items():
+                label = 'operation="%s"' % name.replace("\\", "\\\\").replace('"', '\\"')
+                if quantiles:
+                    for q in OperationMetrics.QUANTILES:
+                        lines.append(
+                            '%s_%s{%s,quantile="%s"} %r'
+                            % (prefix, metric, label, q, values["p%d" % round(q * 100)])
+                        )
+                    lines.append("%s_%s_sum{%s} %r" % (prefix, metric, label, values["elapsed"]))
+                    lines.append("%s_%s_count{%s} %d" % (prefix, metric, label, values["calls"]))
+                else:
+                    lines.append("%s_%s{%s} %r" % (prefix, metric, label, values[key]))
+
+        family("seconds", "summary", "Elapsed time of operations", None, quantiles=True)
+        family("errors_total", "counter", "Number of failed operations", "errors")
+        family("queries_total", "counter", "Number of database queries", "count")
+        return "\n".join(lines) + "\n"
+
+
+METRICS_REGISTRY = MetricsRegistry()
+
+
+def profiled(name, registry=METRICS_REGISTRY):
+    """Decorator recording the metrics of a model method as a named operation
+
+    The elapsed time and query count of every call are gathered using
+    :class:`~.Statistics` and recorded in the metrics registry, including
+    for calls raising an exception.
+    """
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            stats = Statistics(self.env)
+            error = True
+            try:
+                res = func(self, *args, **kwargs)
+                error = False
+                return res
+            finally:
+                stats.stop()
+                registry.record(name, stats.elapsed, stats.count, error=error)
+
+        return wrapper
+
+    return decorator
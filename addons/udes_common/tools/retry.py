@@ -1,5 +1,8 @@
-import time
+from collections import Counter, defaultdict
 import logging
+import random
+import threading
+import time
 from odoo.exceptions import UserError
 from psycopg2 import OperationalError, errorcodes
 
@@ -11,8 +14,91 @@ PG_CONCURRENCY_ERRORS_TO_RETRY = (
     errorcodes.DEADLOCK_DETECTED,
 )
 
+RETRY_COUNTERS = defaultdict(Counter)
+RETRY_COUNTERS_LOCK = threading.Lock()
+
+
+class RetryPolicy(object):
+    """retry policy for concurrency failures
+
+    Retries wait for an exponentially increasing delay, starting from
+    ``base_delay`` seconds and multiplied by ``multiplier`` for every
+    retry up to ``max_delay``.  With ``jitter``, a random wait of up to
+    that delay is used instead ("full jitter"), so that workers which
+    failed together do not retry in lockstep.  The operation is given up
+    after ``max_tries`` retries, or once retrying would take it beyond
+    ``max_elapsed`` seconds, if set.
 
-def odoo_retry(self, func, max_tries, raise_usererrors=True):
+    Counters of calls, retries, successes after retrying and give ups
+    are kept per operation name for the lifetime of the process, see
+    :func:`retry_counters`.
+    """
+
+    def __init__(
+        self,
+        name,
+        max_tries=5,
+        base_delay=0.1,
+        max_delay=5.0,
+        multiplier=2.0,
+        jitter=True,
+        max_elapsed=None,
+    ):
+        self.name = name
+        self.max_tries = max_tries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.max_elapsed = max_elapsed
+
+    def __repr__(self):
+        return "%s(%r, max_tries=%r)" % (type(self).__name__, self.name, self.max_tries)
+
+    def _count(self, *counters):
+        with RETRY_COUNTERS_LOCK:
+            RETRY_COUNTERS[self.name].update(counters)
+
+    def backoff(self, tries):
+        """Time to wait in seconds before the retry number tries (starting from 1)"""
+        delay = min(self.base_delay * self.multiplier ** (tries - 1), self.max_delay)
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    def next_wait(self, tries, started, max_tries=None):
+        """
+        Time to wait in seconds before the retry number tries of an operation
+        started at time.monotonic() ``started``, or None if the operation should be given up.
+        Optionally override the maximum number of retries of the policy with max_tries.
+        """
+        if max_tries is None:
+            max_tries = self.max_tries
+        wait_time = self.backoff(tries)
+        if tries > max_tries or (
+            self.max_elapsed is not None
+            and time.monotonic() - started + wait_time > self.max_elapsed
+        ):
+            self._count("calls", "give_ups")
+            return None
+        self._count("retries")
+        return wait_time
+
+    def succeeded(self, tries):
+        """Count a successful call of the operation after tries retries"""
+        if tries:
+            self._count("calls", "retried_successes")
+        else:
+            self._count("calls")
+
+
+def retry_counters():
+    """Return the retry counters of all operations, by name"""
+    with RETRY_COUNTERS_LOCK:
+        return {name: dict(counters) for name, counters in sorted(RETRY_COUNTERS.items())}
+
+
+def odoo_retry(self, func, max_tries, raise_usererrors=True, policy=None):
     """
     Wrapper function for mimicking Odoo's retry behaviour.
 
@@ -35,20 +121,28 @@ def odoo_retry(self, func, max_tries, raise_usererrors=True):
 
     Param: func: function to wrap
     Param: max_tries: int: maximum number of times to retry
+    Param: policy: RetryPolicy: how to wait between retries, by default named after func.
+        If the policy gives up before max_tries retries (i.e due to max_elapsed), tries is
+        returned as max_tries so callers handle it as reaching the maximum number of tries.
 
     Return: dict(): {"tries": int, ...extra} where extra is what func returns.
 
     """
 
+    if policy is None:
+        policy = RetryPolicy(getattr(func, "__qualname__", str(func)), max_tries=max_tries)
+
     def wrapped_function(*args, **kwargs):
         all_data = {}
         tries = 0
+        started = time.monotonic()
         while True:
             try:
                 with self.env.cr.savepoint():
                     func_data = func(*args, **kwargs)
                     all_data.update(func_data)
-                    break
+                policy.succeeded(tries)
+                break
             except UserError as e:
                 self.invalidate_cache()
                 if raise_usererrors:
@@ -59,13 +153,14 @@ def odoo_retry(self, func, max_tries, raise_usererrors=True):
                 self.invalidate_cache()
                 if e.pgcode not in PG_CONCURRENCY_ERRORS_TO_RETRY:
                     raise
-                if tries >= max_tries:
+                wait_time = policy.next_wait(tries + 1, started, max_tries=max_tries)
+                if wait_time is None:
                     _logger.info(
                         "%s, maximum number of tries reached" % errorcodes.lookup(e.pgcode)
                     )
+                    tries = max_tries
                     break
                 tries += 1
-                wait_time = 1
                 _logger.info(
                     "%s, retry %d/%d in %.04f sec..."
                     % (
@@ -1,9 +1,14 @@
 """Query tracing"""
 
+from collections import namedtuple
 from itertools import takewhile
 import logging
+import os
 import re
+import sys
+import time
 import traceback
+import odoo
 from odoo import models
 from odoo.sql_db import Cursor
 
@@ -13,6 +18,38 @@ _logger = logging.getLogger(__name__)
 # Patch base Cursor class to provide "tracing" attribute
 Cursor.tracing = False
 
+# Directories of code which is never reported as the caller of a query
+ODOO_DIR = os.path.dirname(odoo.__file__)
+ODOO_ADDONS_DIR = os.path.join(ODOO_DIR, "addons")
+
+RepeatedQuery = namedtuple("RepeatedQuery", ("query", "caller", "count", "time"))
+
+# Literals and lists of literals or placeholders within an SQL statement
+SQL_LITERAL = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b|%s|%\(\w+\)s")
+SQL_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+
+
+def normalise_query(query):
+    """Normalise an SQL statement by replacing literals and parameters by ``?``"""
+    if isinstance(query, bytes):
+        query = query.decode()
+    query = SQL_LITERAL.sub("?", str(query))
+    query = SQL_LIST.sub("(?)", query)
+    return " ".join(query.split())
+
+
+def query_caller():
+    """Return the innermost stack frame outside of the Odoo core and this module"""
+    frame = sys._getframe(1)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename != __file__ and (
+            not filename.startswith(ODOO_DIR) or filename.startswith(ODOO_ADDONS_DIR)
+        ):
+            return "%s:%d in %s" % (filename, frame.f_lineno, frame.f_code.co_name)
+        frame = frame.f_back
+    return "unknown"
+
 
 class QueryTracer(object):
     """Query tracer
@@ -63,9 +100,22 @@ class QueryTracer(object):
     The ``stop`` method allows tracing to be stopped for a query
     tracer that is not used as a context manager.
 
+    The optional ``aggregate`` parameter may be used to count the
+    queries rather than logging each of them, in order to find
+    repeated queries (e.g. N+1 queries from searching per record).
+    Queries are normalised by replacing literal values and parameters,
+    and grouped by statement and calling stack frame.  On stopping,
+    any statements executed more than ``threshold`` times from the
+    same caller are logged, along with their count and total time.
+    The repeated queries are also available from ``report``:
+
+        with self.trace(aggregate=True, threshold=5) as tracer:
+            batch.get_next_tasks()
+        self.assertFalse(tracer.report())
+
     """
 
-    def __init__(self, cr, filter=None, max=None):
+    def __init__(self, cr, filter=None, max=None, aggregate=False, threshold=1):
         self.cr = cr
         self.execute = cr.execute
         if filter is None:
@@ -78,6 +128,9 @@ class QueryTracer(object):
             self.filter = filter
         self.max = max
         self.count = 0
+        self.aggregate = aggregate
+        self.threshold = threshold
+        self.queries = {}
         self.tb = traceback.extract_stack()
         self.start()
 
@@ -93,6 +146,9 @@ class QueryTracer(object):
                 if self.count >= self.max:
                     self.stop()
 
+            if self.aggregate:
+                return self.count_query(query, params=params, log_exceptions=log_exceptions)
+
             # Skip all but the innermost common stack frames
             full_tb = traceback.extract_stack()[:-1]
             init_tb = iter(self.tb)
@@ -105,17 +161,50 @@ class QueryTracer(object):
 
         return self.execute(query, params=params, log_exceptions=log_exceptions)
 
+    def count_query(self, query, params=None, log_exceptions=None):
+        """Execute query, counting it by normalised statement and caller"""
+        key = (normalise_query(query), query_caller())
+        start = time.perf_counter()
+        try:
+            return self.execute(query, params=params, log_exceptions=log_exceptions)
+        finally:
+            counts = self.queries.setdefault(key, [0, 0.0])
+            counts[0] += 1
+            counts[1] += time.perf_counter() - start
+
+    def report(self, threshold=None):
+        """Return the queries repeated more than threshold times, most repeated first"""
+        if threshold is None:
+            threshold = self.threshold
+        repeated = [
+            RepeatedQuery(query, caller, count, elapsed)
+            for (query, caller), (count, elapsed) in self.queries.items()
+            if count > threshold
+        ]
+        return sorted(repeated, key=lambda x: (-x.count, -x.time))
+
     def start(self):
         """Start tracing queries"""
         self.count = 0
+        self.queries = {}
         if self.filter:
             self.cr.execute = self.trace
             self.cr.tracing = True
 
     def stop(self):
         """Stop tracing queries"""
+        was_tracing = self.cr.execute == self.trace
         self.cr.execute = self.execute
         self.cr.tracing = False
+        if self.aggregate and was_tracing:
+            for repeated in self.report():
+                _logger.info(
+                    "repeated query: %d times, %.3fs: %s\n%s",
+                    repeated.count,
+                    repeated.time,
+                    repeated.query,
+                    repeated.caller,
+                )
 
     def __enter__(self):
         self.start()
@@ -4,8 +4,11 @@ Provide get_info method and functionality.
 This module automatically adds a get_info method to all models that inherit
 from models.BaseModel.
 """
+import copy
+
 from odoo import fields, models, _
 from odoo.addons.udes_common.models import add_if_not_exists
+from odoo.tools import OrderedSet
 import logging
 
 _logger = logging.getLogger(__name__)
@@ -15,6 +18,88 @@ _logger = logging.getLogger(__name__)
 BASIC_GET_INFO_VALUES = {"id", "name", "display_name"}
 
 
+class InfoSerializer(object):
+    """Serializer for get_info
+
+    A serializer is shared by all the records and related records of a
+    single get_info call, through the context.  It plans the fields to
+    fetch for each model once, reads each field for all the records of a
+    model at a level in bulk, and memoizes the info of each record, so a
+    related record shared by many records (such as the same product or
+    location) is only serialized once per level.  The memoized info is
+    shared, so it must be copied before being handed back to the caller.
+    """
+
+    def __init__(self, info_fields, extra_fields):
+        self.info_fields = info_fields
+        self.extra_fields = extra_fields
+        self.field_plans = {}
+        self.infos = {}
+
+    @classmethod
+    def get(cls, records, info_fields, extra_fields):
+        """Return the serializer of the current get_info call, or a new one"""
+        serializer = records.env.context.get("get_info_serializer")
+        if serializer is None or not serializer.matches(info_fields, extra_fields):
+            serializer = cls(info_fields, extra_fields)
+        return serializer
+
+    def matches(self, info_fields, extra_fields):
+        return self.info_fields == info_fields and self.extra_fields == extra_fields
+
+    def field_plan(self, records):
+        """Return the (info_name, field_name) pairs to fetch for the model of records"""
+        plan = self.field_plans.get(records._name)
+        if plan is None:
+            fields_to_fetch = (
+                self.info_fields
+                if self.info_fields
+                else records._get_info_field_names | BASIC_GET_INFO_VALUES | self.extra_fields
+            )
+            plan = []
+            for field_name in fields_to_fetch:
+                # Allow for name to be changed in info output
+                if isinstance(field_name, tuple):
+                    info_name, field_name = field_name
+                else:
+                    info_name = field_name
+
+                if field_name not in records._fields:
+                    # Ignore fields which don't exist.
+                    _logger.debug(
+                        _("Cannot find field name %r on model %r"), field_name, records._name
+                    )
+                    continue
+                plan.append((info_name, field_name))
+            self.field_plans[records._name] = plan
+        return plan
+
+    def _prefetch(self, records, level):
+        """Read the planned fields of records in bulk, and serialize the related
+        records at the next level down"""
+        loader = records.with_context(prefetch_fields=False)
+        for _info_name, field_name in self.field_plan(records):
+            field = records._fields[field_name]
+            if field.relational and level == 0:
+                continue
+            values = loader.mapped(field_name)
+            if field.relational and values:
+                self.serialize(records.env[field.comodel_name].browse(values._ids), level - 1)
+
+    def serialize(self, records, level):
+        """Return the info of each of records as a list of dicts"""
+        records = records.with_context(get_info_serializer=self)
+        infos = self.infos.setdefault((records._name, level), {})
+        todo = records.browse(OrderedSet(x for x in records._ids if x not in infos))
+        if todo:
+            self._prefetch(todo, level)
+            for record in todo:
+                infos[record.id] = record._get_info(
+                    level=level, info_fields=self.info_fields, extra_fields=self.extra_fields
+                )
+        return [infos[x] for x in records._ids]
+
+
 @add_if_not_exists(models.BaseModel)
 def get_info(self, level=1, info_fields=frozenset(), extra_fields=frozenset(), **kwargs):
     """
@@ -32,38 +117,26 @@ def get_info(self, level=1, info_fields=frozenset(), extra_fields=frozenset(), *
         extra_fields: set[str[tuple[str, str]]: return these fields in addition to the defaults; ignored if info_fields is provided
     Fields may be defined as a tuple (alt_name, attr_name), in which case the
     alternative name will be used instead of the attribute name in the returned dicts.
+
+    The info of a record related to several records is only built once, but
+    each returned dict is a copy, so it can be modified freely.
     """
-    return [
-        x._get_info(level=level, info_fields=info_fields, extra_fields=extra_fields, **kwargs)
-        for x in self
-    ]
+    serializer = InfoSerializer.get(self, info_fields, extra_fields)
+    return [copy.deepcopy(info) for info in serializer.serialize(self, level)]
 
 
 @add_if_not_exists(models.BaseModel)
 def _get_info(self, level, info_fields, extra_fields):
     self.ensure_one()
 
-    fields_to_fetch = (
-        info_fields
-        if info_fields
-        else self._get_info_field_names | BASIC_GET_INFO_VALUES | extra_fields
-    )
+    serializer = InfoSerializer.get(self, info_fields, extra_fields)
 
     info = {}
-    for field_name in fields_to_fetch:
-        # Allow for name to be changed in info output
-        if isinstance(field_name, tuple):
-            info_name, field_name = field_name
-        else:
-            info_name = field_name
-
-        if field_name not in self:
-            # Ignore fields which don't exist.
-            _logger.debug(_("Cannot find field name %r on model %r"), field_name, self._name)
+    for info_name, field_name in serializer.field_plan(self):
+        if level == 0 and self._fields[field_name].relational:
             continue
-
         result = self[field_name]
-        if isinstance(self[field_name], models.BaseModel):
+        if isinstance(result, models.BaseModel):
             # Stop recursing once we reach level zero or if the field is empty.
             if level == 0:
                 continue
@@ -77,13 +150,9 @@ def _get_info(self, level, info_fields, extra_fields):
             # Note: default_barcode will be picked from every model that field exist and will
             # log a messsage for every model where it is not found.
             elif isinstance(self._fields.get(field_name), fields.Many2one):
-                _info = result._get_info(
-                    level=level - 1, info_fields=info_fields, extra_fields=extra_fields
-                )
+                _info = serializer.serialize(result, level - 1)[0]
             else:
-                _info = result.get_info(
-                    level=level - 1, info_fields=info_fields, extra_fields=extra_fields
-                )
+                _info = serializer.serialize(result, level - 1)
         else:
             _info = result
 
@@ -198,3 +198,28 @@ class TestGetInfo(common.BaseTestCase):
 
         self.assertNotIn("barcode", info)
         self.assertEqual(info["stripes"], "LTESTGRANDCHILD")
+
+    def test_serializes_shared_related_records_once(self):
+        """Info for a recordset matches the info of each record, with related records
+        shared between the records serialized once.
+        """
+        apple = self.create_product(name="Apple")
+        quants = self.create_quant(apple.id, self.grandchild_location.id, 1)
+        quants |= self.create_quant(apple.id, self.child_location.id, 1)
+
+        info = quants.get_info(level=2)
+
+        self.assertEqual(info, [quant.get_info(level=2)[0] for quant in quants])
+
+    def test_returned_info_of_shared_related_records_is_independent(self):
+        """Modifying the info of a related record shared between records does not
+        change the info returned for the other records.
+        """
+        apple = self.create_product(name="Apple")
+        quants = self.create_quant(apple.id, self.grandchild_location.id, 1)
+        quants |= self.create_quant(apple.id, self.child_location.id, 1)
+
+        info = quants.get_info(level=2)
+        info[0]["product_id"]["name"] = "Banana"
+
+        self.assertEqual(info[1]["product_id"]["name"], "Apple")
@@ -23,7 +23,7 @@ class EdiSaleRequestDocument(models.AbstractModel):
         reqs = SaleLineRequestRecord.search([("doc_id", "=", doc.id)])
         with self.statistics() as stats:
             moves = reqs.mapped("sale_line_id.move_ids")
-            moves._action_refactor()
+            moves._action_refactor(source="execute")
         _logger.info("%s refactored in %.2fs, %d queries", doc.name, stats.elapsed, stats.count)
 
     def _extract_invalid_order_line(self, line):
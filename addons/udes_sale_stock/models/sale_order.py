@@ -7,6 +7,7 @@ from datetime import timedelta, date, datetime
 import time
 import traceback
 from odoo.addons.udes_common import exceptions
+from odoo.addons.udes_common.tools import RetryPolicy
 
 from psycopg2 import OperationalError, errorcodes
 
@@ -217,6 +218,11 @@ class SaleOrder(models.Model):
             #     extra SQL queries. mapped('order_line.move_ids') followed by
             #     with_context and mapped('state') does not.
 
+            # Get the available stock of all products new to this batch at once
+            products = batch.mapped("order_line").filtered(lambda x: not x.is_cancelled).product_id
+            new_products = products.filtered(lambda p: p not in stock)
+            stock.update(Quant.get_available_quantities(new_products, locations))
+
             for order in batch:
                 # Loop SO lines and deduct from stock dict, add order lines to
                 # can or cant fulfill record sets
@@ -231,9 +237,6 @@ class SaleOrder(models.Model):
                         continue
 
                     product = line.product_id
-
-                    if product not in stock.keys():
-                        stock[product] = Quant.get_available_quantity(product, locations)
                     qty_ordered = line.product_uom_qty
                     if stock[product] >= qty_ordered:
                         stock[product] = stock[product] - qty_ordered
@@ -315,17 +318,15 @@ class SaleOrder(models.Model):
         domain = [("state", "=", "sale"), ("is_cancelled", "=", False)]
         if products:
             domain.append(("product_id", "in", products.ids))
-        # Override the search order since the default model order can involve
-        # joins, which perform poorly, and the order does not matter here.
-        order_lines = OrderLine.search(domain, order="id")
         demand = defaultdict(int)
 
-        for r, batch in order_lines.batched(size=1000):
-            # Cache the needed fields and only the needed fields
-            # See cancel_sale_orders_without_availability for details
-            batch.read(["is_cancelled", "product_id", "product_uom_qty"], load="_classic_write")
-            batch.mapped("move_ids")
-            batch.mapped("move_ids").read(["state"], load="_classic_write")
+        # Cache the needed fields and only the needed fields, a page at a time
+        # See cancel_sale_orders_without_availability for details
+        for batch in OrderLine.search_iter(
+            domain,
+            batch_size=1000,
+            fields=["is_cancelled", "product_id", "product_uom_qty", "move_ids.state"],
+        ):
             for line in batch:
                 # If any of the moves are done or cancelled then skip this line
                 line_states = line.mapped("move_ids.state")
@@ -334,9 +335,6 @@ class SaleOrder(models.Model):
                 product = line.product_id
                 demand[product] += line.product_uom_qty
 
-            # Empty cached stuff
-            batch.invalidate_cache()
-
         return demand
 
     def action_confirm(self):
@@ -371,30 +369,40 @@ class SaleOrder(models.Model):
             .get_param("udes_sale_stock.max_tries_on_concurrency_failure", 5)
         )
 
+        retry_policy = RetryPolicy(
+            "sale.order.confirm_orders", max_tries=MAX_TRIES_ON_CONCURRENCY_FAILURE
+        )
+
         if self:
-            to_confirm = self
+            batches = (batch for _, batch in self.batched(size=size))
         else:
-            to_confirm = self.search(self._get_confirmation_domain())
+            # Confirm the orders in order of requested date and priority
+            batches = self.search_iter(
+                self._get_confirmation_domain(), batch_size=size, order=self._order
+            )
 
-        for _, batch in to_confirm.batched(size=size):
+        for batch in batches:
             tries = 0
+            started = time.monotonic()
             while True:
                 try:
                     with self.env.cr.savepoint():
                         batch.with_context(recompute=False).action_confirm()
                         batch.recompute()
-                        break
+                    retry_policy.succeeded(tries)
+                    break
                 except OperationalError as e:
                     self.invalidate_cache()
                     if e.pgcode not in PG_CONCURRENCY_ERRORS_TO_RETRY:
                         raise
-                    if tries >= MAX_TRIES_ON_CONCURRENCY_FAILURE:
+                    wait_time = retry_policy.next_wait(tries + 1, started)
+                    if wait_time is None:
                         _logger.info(
                             "%s, maximum number of tries reached" % errorcodes.lookup(e.pgcode)
                         )
+                        tries = MAX_TRIES_ON_CONCURRENCY_FAILURE
                         break
                     tries += 1
-                    wait_time = 1
                     _logger.info(
                         "%s, retry %d/%d in %.04f sec..."
                         % (
@@ -58,6 +58,25 @@ class ByCustomer(SuggestLocationPolicy):
             lambda ml: ml.move_id.sale_line_id.order_id.partner_id == customer
         ).location_id  # Can be singleton, multi, or emptyset!
 
+    def location_is_suggested(self, drop_location, customer, location, **kwargs):
+        """
+        Check the drop location holds stock derived from a sales order
+        for the same customer as the one passed in.
+        """
+        StockMoveLine = self.env["stock.move.line"]
+        domain = [
+            ("state", "=", "assigned"),
+            ("location_id", "child_of", location.id),
+            ("location_id", "=", drop_location.id),
+        ]
+        if not customer:
+            # As in get_locations, move lines without a sale order match an empty customer,
+            # which a domain on the sale order would exclude
+            move_lines = StockMoveLine.search(domain)
+            return any(not ml.move_id.sale_line_id.order_id.partner_id for ml in move_lines)
+        domain.append(("move_id.sale_line_id.order_id.partner_id", "=", customer.id))
+        return bool(StockMoveLine.search(domain, limit=1))
+
     def iter_mls(self, mls):
         for _customer, grouped_mls in mls.groupby(
             lambda ml: ml.move_id.sale_line_id.order_id.partner_id
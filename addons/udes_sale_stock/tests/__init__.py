@@ -1,3 +1,4 @@
 from . import test_sale_order
 from . import test_full_sale_reservation
 from . import test_sale_order_delivery_status
+from . import test_suggest_locations
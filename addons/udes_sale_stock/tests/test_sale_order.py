@@ -2,6 +2,7 @@ from odoo.addons.udes_stock.tests import common
 from odoo import fields
 from datetime import datetime
 import freezegun
+from unittest.mock import patch
 
 
 class TestSaleOrder(common.BaseUDESPullOutboundRoute):
@@ -138,3 +139,25 @@ class TestSaleOrder(common.BaseUDESPullOutboundRoute):
 
         self.assertEqual(sale_order.order_line.qty_to_deliver, 10)
         self.assertFalse(sale_order.order_line.display_qty_widget)
+
+    def test_confirm_orders_in_priority_order(self):
+        """Orders to confirm are confirmed by requested date and priority rather than id."""
+        SaleOrder = self.env["sale.order"]
+
+        normal_order = self._create_sale_order(self.apple.id, 1)
+        urgent_order = self._create_sale_order(self.apple.id, 1)
+        (normal_order | urgent_order).write({"requested_date": fields.Datetime.now()})
+        urgent_order.priority = "1"
+        self.assertGreater(urgent_order.id, normal_order.id)
+
+        confirmed_ids = []
+        action_confirm = type(SaleOrder).action_confirm
+
+        def record_action_confirm(orders):
+            confirmed_ids.extend(orders.ids)
+            return action_confirm(orders)
+
+        with patch.object(type(SaleOrder), "action_confirm", record_action_confirm):
+            SaleOrder.confirm_orders(size=1)
+        self.assertLess(confirmed_ids.index(urgent_order.id), confirmed_ids.index(normal_order.id))
+        self.assertEqual((normal_order | urgent_order).mapped("state"), ["sale", "sale"])
@@ -0,0 +1,64 @@
+"""Tests for the suggest location policies of sale orders"""
+from odoo.addons.udes_suggest_location.registry.suggest_locations_policy import (
+    SUGGEST_LOCATION_REGISTRY,
+)
+from .common import BaseSaleUDES
+
+
+class TestSuggestBySaleOrder(BaseSaleUDES):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.ByCarrier = SUGGEST_LOCATION_REGISTRY["by_carrier"](cls.env)
+        cls.ByCustomer = SUGGEST_LOCATION_REGISTRY["by_customer"](cls.env)
+        # Stock reserved by a picking without a sale order
+        cls.create_quant(cls.apple.id, cls.test_stock_location_01.id, 10)
+        cls.picking = cls.create_picking(
+            cls.picking_type_pick,
+            products_info=[{"product": cls.apple, "uom_qty": 4}],
+            confirm=True,
+            assign=True,
+        )
+
+    def test_location_is_suggested_for_empty_carrier(self):
+        """Locations of move lines without a sale order are suggested for an empty carrier,
+        as in get_locations"""
+        carrier = self.env["udes.carrier"].browse()
+        self.assertIn(
+            self.test_stock_location_01,
+            self.ByCarrier.get_locations(carrier=carrier, location=self.stock_location),
+        )
+        self.assertTrue(
+            self.ByCarrier.location_is_suggested(
+                self.test_stock_location_01, carrier=carrier, location=self.stock_location
+            )
+        )
+
+    def test_location_is_suggested_for_empty_customer(self):
+        """Locations of move lines without a sale order are suggested for an empty customer,
+        as in get_locations"""
+        customer = self.env["res.partner"].browse()
+        self.assertIn(
+            self.test_stock_location_01,
+            self.ByCustomer.get_locations(customer=customer, location=self.stock_location),
+        )
+        self.assertTrue(
+            self.ByCustomer.location_is_suggested(
+                self.test_stock_location_01, customer=customer, location=self.stock_location
+            )
+        )
+
+    def test_location_outside_location_is_not_suggested(self):
+        """A drop location which is not within the location is not suggested"""
+        carrier = self.env["udes.carrier"].browse()
+        customer = self.env["res.partner"].browse()
+        self.assertFalse(
+            self.ByCarrier.location_is_suggested(
+                self.test_stock_location_01, carrier=carrier, location=self.received_location
+            )
+        )
+        self.assertFalse(
+            self.ByCustomer.location_is_suggested(
+                self.test_stock_location_01, customer=customer, location=self.received_location
+            )
+        )
@@ -1,4 +1,6 @@
-from odoo import api, fields, models, _
+from collections import defaultdict
+
+from odoo import api, fields, models, tools, _
 from odoo.exceptions import ValidationError
 from odoo.osv import expression
 
@@ -32,6 +34,37 @@ class MixinStockModel(models.AbstractModel):
 
         return domain
 
+    @api.model
+    @tools.ormcache("self._name", "self.env.lang")
+    def _get_msm_model_name(self):
+        """Return the display name of the model, for error messages"""
+        return self.env["ir.model"].sudo()._get(self._name).name
+
+    def _check_msm_aux_domain(self, aux_domain):
+        """Check the auxiliary domain of get_or_create is a list"""
+        if aux_domain and not isinstance(aux_domain, list):
+            raise ValidationError(_("Aux domain for get_or_create() should be a list."))
+
+    def _raise_msm_not_found(self, identifier, create):
+        """Raise the error for an identifier which is not found and cannot be created"""
+        model = self._name
+        model_name = self._get_msm_model_name()
+        if self.MSM_CREATE and create:
+            raise ValidationError(
+                _("Cannot create a new %s for %s with identifier of type %s")
+                % (model_name, model, type(identifier))
+            )
+        elif create:
+            raise ValidationError(_("Cannot create a new %s for %s") % (model_name, model))
+        raise ValidationError(_("%s not found for identifier %s") % (model_name, identifier))
+
+    def _raise_msm_too_many(self, identifier):
+        """Raise the error for an identifier which matches more than one record"""
+        raise ValidationError(
+            _("Too many %ss found for identifier %s in %s")
+            % (self._get_msm_model_name(), identifier, self._name)
+        )
+
     def get_or_create(
         self, identifier, create=False, create_sudo=False, aux_domain=None, return_empty=False, **kwargs
     ):
@@ -56,16 +89,10 @@ class MixinStockModel(models.AbstractModel):
         :returns:
             Object of the model queried
         """
-        IrModel = self.env["ir.model"]
-
-        model = self._name
-        model_name = IrModel.search([("model", "=", self._name)]).name
         # Prepare domain for search
         domain = self._get_msm_domain(identifier)
         if aux_domain:
-            if not isinstance(aux_domain, list):
-                raise ValidationError(_("Aux domain for get_or_create() should be a list."))
-
+            self._check_msm_aux_domain(aux_domain)
             domain.extend(aux_domain)
         # Search overriding order for performance
         results = self.search(domain, order="id")
@@ -79,20 +106,82 @@ class MixinStockModel(models.AbstractModel):
                 if kwargs:
                     create_vals.update(kwargs)
                 results = model_instance.create(create_vals)
-            elif self.MSM_CREATE and create:
-                raise ValidationError(
-                    _("Cannot create a new %s for %s with identifier of type %s")
-                    % (model_name, model, type(identifier))
+            elif create or not return_empty:
+                self._raise_msm_not_found(identifier, create)
+        elif len(results) > 1:
+            self._raise_msm_too_many(identifier)
+        return results
+
+    def get_or_create_many(
+        self, identifiers, create=False, create_sudo=False, aux_domain=None, return_empty=False, **kwargs
+    ):
+        """Gets the objects of the model for many identifiers at once, as get_or_create.
+            All identifiers are searched for in a single query, and any objects to be
+            created are created together.
+        :args:
+            - identifiers: iterable of str or int
+                The identifiers to search by
+        :kwargs:
+            As get_or_create
+        :returns:
+            Dictionary of each identifier to the object of the model found or created for it,
+            which is empty if return_empty is set and nothing was found
+        """
+        identifiers = list(dict.fromkeys(identifiers))
+        str_identifiers = []
+        int_identifiers = []
+        for identifier in identifiers:
+            if isinstance(identifier, str):
+                str_identifiers.append(identifier)
+            elif isinstance(identifier, int):
+                int_identifiers.append(identifier)
+            else:
+                # Raise the same error as get_or_create
+                self._get_msm_domain(identifier)
+        if not identifiers:
+            return {}
+
+        # Prepare domain for search
+        domains = [[(field, "in", str_identifiers)] for field in self.MSM_STR_DOMAIN]
+        domains.append([("id", "in", int_identifiers)])
+        domain = expression.OR(domains)
+        if aux_domain:
+            self._check_msm_aux_domain(aux_domain)
+            domain = expression.AND([domain, aux_domain])
+        # Search overriding order for performance
+        records = self.search(domain, order="id")
+
+        # Match the records found to the identifiers they were found by
+        record_ids_by_identifier = defaultdict(dict)
+        for row in records.read(list(self.MSM_STR_DOMAIN)):
+            record_ids_by_identifier[row["id"]][row["id"]] = True
+            for field in self.MSM_STR_DOMAIN:
+                if row[field]:
+                    record_ids_by_identifier[row[field]][row["id"]] = True
+
+        results = {}
+        to_create = []
+        for identifier in identifiers:
+            record_ids = list(record_ids_by_identifier.get(identifier, ()))
+            if len(record_ids) > 1:
+                self._raise_msm_too_many(identifier)
+            elif record_ids:
+                results[identifier] = records.browse(record_ids).with_prefetch(
+                    records._prefetch_ids
                 )
-            elif create:
-                raise ValidationError(_("Cannot create a new %s for %s") % (model_name, model))
+            elif self.MSM_CREATE and create and isinstance(identifier, str):
+                to_create.append(identifier)
+            elif create or not return_empty:
+                self._raise_msm_not_found(identifier, create)
             else:
-                if not return_empty:
-                    raise ValidationError(
-                        _("%s not found for identifier %s") % (model_name, identifier)
-                    )
-        elif len(results) > 1:
-            raise ValidationError(
-                _("Too many %ss found for identifier %s in %s") % (model_name, identifier, model)
+                results[identifier] = self.browse()
+
+        if to_create:
+            model_instance = self
+            if self.MSM_CREATE_SUDO and create_sudo:
+                model_instance = model_instance.sudo()
+            created = model_instance.create(
+                [dict({"name": identifier}, **kwargs) for identifier in to_create]
             )
+            results.update(zip(to_create, created))
         return results
@@ -19,3 +19,22 @@ class ProductBarcode(models.Model):
     _sql_constraints = [
         ("name_uniq", "unique(name)", "A barcode can only be assigned to one product!"),
     ]
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        """Extend create to clear the cached products by barcode"""
+        product_barcodes = super().create(vals_list)
+        self.env["product.product"]._clear_barcode_cache()
+        return product_barcodes
+
+    def write(self, vals):
+        """Extend write to clear the cached products by barcode"""
+        res = super().write(vals)
+        self.env["product.product"]._clear_barcode_cache()
+        return res
+
+    def unlink(self):
+        """Extend unlink to clear the cached products by barcode"""
+        res = super().unlink()
+        self.env["product.product"]._clear_barcode_cache()
+        return res
@@ -1,6 +1,7 @@
-from odoo import fields, models, api, _
+from odoo import fields, models, api, tools, _
 from odoo.exceptions import ValidationError
 from . common import check_upper_case_validation
+from collections import defaultdict
 import logging
 
 _logger = logging.getLogger(__name__)
@@ -131,14 +132,22 @@ class ProductProduct(models.Model):
             measure_type_label = "Eaches"
         return str(quantity), measure_type, measure_type_label
 
+    # Fields which change the product found by a barcode
+    BARCODE_CACHE_FIELDS = {"barcode", "active", "product_tmpl_id"}
+
     @api.model
     def create(self, vals):
         check_upper_case_validation(self._name, self.env.user, vals)
-        return super().create(vals)
+        product = super().create(vals)
+        self._clear_barcode_cache()
+        return product
 
     def write(self, vals):
         check_upper_case_validation(self._name, self.env.user, vals)
-        return super().write(vals)
+        res = super().write(vals)
+        if not self.BARCODE_CACHE_FIELDS.isdisjoint(vals):
+            self._clear_barcode_cache()
+        return res
 
     def get_barcode(self):
         """
@@ -169,27 +178,119 @@ class ProductProduct(models.Model):
         Getting the product from barcode, looking in product table or product barcode table depending on the config.
 
         If barcode is a list of barcodes, of the same product. There are scenarios where is called like that.
+
+        The products found are cached by barcode, so scanning a barcode again does not query the database.
         """
-        Product = self.env["product.product"]
-        ProductBarcode = self.env["product.barcode"]
+        barcode_key = tuple(barcode) if isinstance(barcode, list) else barcode
+        product_ids = self._get_product_ids_by_barcode(
+            barcode_key, self.env.context.get("active_test", True)
+        )
+        return self._get_readable_products({barcode_key: product_ids})[barcode_key]
+
+    @api.model
+    def get_by_barcodes(self, barcodes):
+        """
+        Getting the products of many barcodes at once, as get_by_barcode, returning a dictionary of
+        each barcode to its product. Barcodes which are lists of barcodes of the same product are keyed
+        by a tuple of the barcodes.
+
+        Barcodes are all looked up in a single query, apart from a single barcode which uses the
+        cached lookup of get_by_barcode.
+        """
+        barcode_keys = list(
+            dict.fromkeys(tuple(barcode) if isinstance(barcode, list) else barcode for barcode in barcodes)
+        )
+        if not barcode_keys:
+            return {}
+        if len(barcode_keys) == 1:
+            # Use the cached lookup
+            barcode_key = barcode_keys[0]
+            barcode = list(barcode_key) if isinstance(barcode_key, tuple) else barcode_key
+            return {barcode_key: self.get_by_barcode(barcode)}
+        active_test = self.env.context.get("active_test", True)
+        return self._get_readable_products(self._search_product_ids_by_barcodes(barcode_keys, active_test))
+
+    @api.model
+    def _get_readable_products(self, product_ids_by_key):
+        """
+        Return a dictionary of the products of each key of product_ids_by_key, as found as superuser,
+        restricted to the products the current user can read.
+        """
+        self.check_access_rights("read")
+        readable = self.browse(
+            {product_id for product_ids in product_ids_by_key.values() for product_id in product_ids}
+        )._filter_access_rules("read")
+        readable_ids = set(readable.ids)
+
+        products_by_key = {}
+        for key, product_ids in product_ids_by_key.items():
+            product = self.browse([x for x in product_ids if x in readable_ids])
+            if len(product) > 1:
+                raise ValidationError(
+                    _("Can not determine a single product from the provided barcodes. Found: %s") % product.mapped(
+                        "name"))
+            products_by_key[key] = product.with_prefetch(readable._prefetch_ids)
+        return products_by_key
+
+    @api.model
+    def _clear_barcode_cache(self):
+        """
+        Clear the cached products by barcode, through the registry cache invalidation.
+
+        The cache is cleared again once the change is committed, as a concurrent request could
+        cache the products found before the change in the meantime.
+        """
+        self.clear_caches()
+        self.env.cr.after("commit", self.clear_caches)
+
+    @api.model
+    @tools.ormcache("barcode", "active_test")
+    def _get_product_ids_by_barcode(self, barcode, active_test):
+        """
+        Return the ids of the products found by barcode, as a tuple so it can be cached.
+
+        The lookup is done as superuser so the cached ids do not depend on the user, and the cache is cleared
+        whenever product barcodes or the multiple barcodes configuration change.
+        """
+        return self._search_product_ids_by_barcodes([barcode], active_test)[barcode]
+
+    @api.model
+    def _search_product_ids_by_barcodes(self, barcode_keys, active_test):
+        """
+        Return a dictionary of the ids of the products found as superuser by each barcode key, looking in
+        product table or product barcode table depending on the config, in a single query.
+        """
+        Product = self.env["product.product"].sudo().with_context(active_test=active_test)
+        ProductBarcode = self.env["product.barcode"].sudo().with_context(active_test=active_test)
         warehouse = self.env.ref("stock.warehouse0")
-        product = Product.browse()
-        if warehouse.u_product_multiple_barcodes:
+        multiple_barcodes = warehouse.u_product_multiple_barcodes
+
+        barcode_names = {
+            name for key in barcode_keys for name in (key if isinstance(key, tuple) else [key])
+        }
+        product_ids_by_barcode = defaultdict(list)
+        if multiple_barcodes:
             # Using in operator when searching for the product, as the first one might be a new barcode.
-            # We want to make sure product doesn't exist.
-            if not isinstance(barcode, list):
-                barcode = [barcode]
-            product_barcodes = ProductBarcode.search([("name", "in", barcode)], order="id")
-            if product_barcodes:
-                product = product_barcodes.product_tmpl_id.product_variant_ids
-                if len(product) > 1:
-                    raise ValidationError(
-                        _("Can not determine a single product from the provided barcodes. Found: %s") % product.mapped(
-                            "name"))
+            product_barcodes = ProductBarcode.search([("name", "in", list(barcode_names))], order="id")
+            for product_barcode in product_barcodes:
+                product_ids_by_barcode[product_barcode.name].extend(
+                    product_barcode.product_tmpl_id.product_variant_ids.ids
+                )
         else:
-            # Because of sql_constraint there is only one record in case found
-            product = Product.search([("barcode", "=", barcode)], order="id", limit=1)
-        return product
+            # Because of sql_constraint there is only one product for each barcode
+            products = Product.search([("barcode", "in", list(barcode_names))], order="id")
+            for product in products:
+                product_ids_by_barcode[product.barcode].append(product.id)
+
+        product_ids_by_key = {}
+        for key in barcode_keys:
+            names = key if isinstance(key, tuple) else [key]
+            product_ids = [product_id for name in names for product_id in product_ids_by_barcode[name]]
+            if not multiple_barcodes:
+                # Only the first product found is used, as when searching with a limit
+                product_ids = sorted(product_ids)[:1]
+            product_ids_by_key[key] = tuple(dict.fromkeys(product_ids))
+        return product_ids_by_key
 
     def _get_info(self, level, info_fields, extra_fields):
         """Inherit with super to extend _get_info by adding more values or tweaking existing ones."""
@@ -29,26 +29,14 @@ class StockLocation(models.Model):
 
         If not set on self, get the format of the nearest ancestor that specifies a format.
         """
-        Location = self.env["stock.location"]
-
+        nearest_ancestors = self._get_nearest_ancestors(
+            [("u_location_storage_format", "!=", False)]
+        )
         for location in self:
-            storage_format = location.u_location_storage_format
-            if storage_format:
-                location.u_storage_format = storage_format
-                continue
-            # Check ancestors
-            parent_storage_format = False
-            parent = location.location_id
-            while not parent_storage_format and parent:
-                # No need to read all fields but only parent and storage_format fields
-                result = parent.read(fields=["location_id", "u_location_storage_format"])
-                if result[0].get("location_id"):
-                    parent_id = result[0].get("location_id")[0]
-                    parent = Location.browse(parent_id)
-                else:
-                    parent = False
-                parent_storage_format = result[0].get("u_location_storage_format", False)
-            location.u_storage_format = parent_storage_format
+            location.u_storage_format = (
+                location.u_location_storage_format
+                or nearest_ancestors[location].u_location_storage_format
+            )
 
     @api.depends(
         "u_unreserving_configuration",
@@ -60,30 +48,57 @@ class StockLocation(models.Model):
 
         If not set on self, get the configuration of the nearest ancestor that has enabled unreserving configuration enabled.
         """
-        Location = self.env["stock.location"]
-
         internal_locations = self.filtered(lambda l: l.usage == "internal")
         other_locations = self - internal_locations
         for other_location in other_locations:
             other_location.u_unreserving = False
+        nearest_ancestors = internal_locations._get_nearest_ancestors(
+            [("u_unreserving_configuration", "=", True)]
+        )
         for internal_location in internal_locations:
-            unreserving_config = internal_location.u_unreserving_configuration
-            if unreserving_config:
-                internal_location.u_unreserving = unreserving_config
-                continue
-            # Check ancestors
-            parent_unreserving_config = False
-            parent = internal_location.location_id
-            while not parent_unreserving_config and parent:
-                # No need to read all fields but only parent and storage_format fields
-                result = parent.read(fields=["location_id", "u_unreserving_configuration"])
-                if result[0].get("location_id"):
-                    parent_id = result[0].get("location_id")[0]
-                    parent = Location.browse(parent_id)
-                else:
-                    parent = False
-                parent_unreserving_config = result[0].get("u_unreserving_configuration", False)
-            internal_location.u_unreserving = parent_unreserving_config
+            internal_location.u_unreserving = (
+                internal_location.u_unreserving_configuration
+                or nearest_ancestors[internal_location].u_unreserving_configuration
+            )
+
+    def _get_nearest_ancestors(self, domain, include_self=False):
+        """Find the nearest ancestor of each location in self matching domain.
+
+        The ancestors of all the locations are taken from the parent_path of
+        their parents and searched with a single query, rather than walking up
+        the hierarchy of each location. Archived ancestors are included, as
+        when following location_id.
+
+        :kwargs:
+            - include_self: Boolean, when True a location matching domain is
+              its own nearest ancestor, like the parent_of operator
+        :returns: a dictionary mapping each location in self to its nearest
+            ancestor matching domain, or an empty recordset if there is none
+        """
+        Location = self.env["stock.location"]
+
+        # parent_path is only updated once a change of parent is flushed, so flush
+        # any pending change of parent of these locations or their parents
+        Location.flush(["location_id"], self._origin | self.location_id._origin)
+        ancestor_ids_by_location = {}
+        for location in self:
+            parent = location._origin if include_self else location.location_id._origin
+            path = (parent.parent_path or "") if parent else ""
+            ancestor_ids_by_location[location] = [int(x) for x in reversed(path.split("/")) if x]
+        all_ancestor_ids = set().union(*ancestor_ids_by_location.values())
+        matching = Location
+        if all_ancestor_ids:
+            matching = Location.with_context(active_test=False).search(
+                [("id", "in", list(all_ancestor_ids))] + domain
+            )
+        # Records from iterating share a prefetch set, so are read together
+        matching_by_id = {ancestor.id: ancestor for ancestor in matching}
+        return {
+            location: next(
+                (matching_by_id[x] for x in ancestor_ids if x in matching_by_id), Location
+            )
+            for location, ancestor_ids in ancestor_ids_by_location.items()
+        }
 
     def _domain_speed_category(self):
         """Domain for speed product category"""
@@ -308,15 +323,15 @@ class StockLocation(models.Model):
     @api.depends("u_location_is_countable", "location_id", "location_id.u_is_countable")
     def _compute_is_countable(self):
         """Determine whether stock locations are countable"""
+        nearest_ancestors = self._get_nearest_ancestors(
+            [("u_location_is_countable", "in", ("yes", "no"))]
+        )
         for location in self:
-            is_countable = False
-            if location.u_location_is_countable in ("yes", "no"):
-                is_countable = location.u_location_is_countable == "yes"
-            else:
-                parent = location.location_id
-                if parent.u_is_countable:
-                    is_countable = True
-            location.u_is_countable = is_countable
+            is_countable_config = (
+                location.u_location_is_countable
+                or nearest_ancestors[location].u_location_is_countable
+            )
+            location.u_is_countable = is_countable_config == "yes"
 
     @api.depends("quant_ids", "usage", "active", "u_is_countable")
     def _compute_countable_state(self):
@@ -348,26 +363,13 @@ class StockLocation(models.Model):
         closest in the location hierarchy.
         If no picking zone is found, False is set.
         """
-        Location = self.env["stock.location"]
-
-        for record in self:
-            if not isinstance(record.id, models.NewId):
-                if record.u_is_picking_zone:
-                    record.u_picking_zone_id = record.id
-                else:
-                    result = Location.search_read(
-                        [("u_is_picking_zone", "=", True), ("id", "parent_of", record.id)], ["id"]
-                    )
-                    if len(result) == 1:
-                        record.u_picking_zone_id = result[0]["id"]
-                    elif len(result) > 1:
-                        # The query result is ordered by name and id, which doesn't
-                        # help us find the closest zone in the hierarchy.
-                        path_ids = list(map(int, filter(None, record.parent_path.split("/"))))
-                        result_ids = [x["id"] for x in result]
-                        record.u_picking_zone_id = max(result_ids, key=path_ids.index)
-                    else:
-                        record.u_picking_zone_id = False
+        locations = self.filtered(lambda l: not isinstance(l.id, models.NewId))
+        nearest_ancestors = locations._get_nearest_ancestors([("u_is_picking_zone", "=", True)])
+        for record in locations:
+            if record.u_is_picking_zone:
+                record.u_picking_zone_id = record.id
+            else:
+                record.u_picking_zone_id = nearest_ancestors[record]
         return
 
     def _set_countable_state(self):
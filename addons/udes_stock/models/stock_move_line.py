@@ -182,14 +182,58 @@ class StockMoveLine(models.Model):
 
     def get_quants(self):
         """Returns the quants related to move lines in self"""
-        Quant = self.env["stock.quant"]
+        quants, _quants_by_ml = self.get_quants_by_move_line()
+        return quants
 
-        quants = Quant.browse()
-        for ml in self:
-            domain = ml._get_search_domain(strict=True)
-            quants |= Quant.search(domain)
+    def get_quants_by_move_line(self):
+        """
+        Returns the quants related to move lines in self, along with a dictionary of
+        the quants of each move line.
 
-        return quants
+        The quants of a move line are those matching its strict search domain, i.e. with
+        the same product, lot, package, owner and location. The quants of all the move
+        lines are found in a single query, joining the quants against the values of the
+        move lines.
+        """
+        Quant = self.env["stock.quant"]
+
+        key_fields = ["product_id", "lot_id", "package_id", "owner_id", "location_id"]
+        if not self:
+            return Quant.browse(), {}
+
+        self.flush(key_fields)
+        Quant.flush(key_fields)
+        rows = self.read(key_fields, load="_classic_write")
+        values = [tuple(row[field] or None for field in ["id"] + key_fields) for row in rows]
+        self.env.cr.execute(
+            """
+                SELECT q.id, v.ml_id
+                FROM stock_quant q
+                JOIN (VALUES %s) AS v(ml_id, product_id, lot_id, package_id, owner_id, location_id)
+                    ON q.product_id = v.product_id
+                    AND q.location_id = v.location_id
+                    AND q.lot_id IS NOT DISTINCT FROM v.lot_id::integer
+                    AND q.package_id IS NOT DISTINCT FROM v.package_id::integer
+                    AND q.owner_id IS NOT DISTINCT FROM v.owner_id::integer
+            """
+            % ", ".join(["%s"] * len(values)),
+            values,
+        )
+        ml_ids_by_quant = defaultdict(list)
+        for quant_id, ml_id in self.env.cr.fetchall():
+            ml_ids_by_quant[quant_id].append(ml_id)
+
+        # Search the matched quants to apply access rules and the quant order
+        quants = Quant.search([("id", "in", list(ml_ids_by_quant))])
+        quant_ids_by_ml = defaultdict(list)
+        for quant_id in quants.ids:
+            for ml_id in ml_ids_by_quant[quant_id]:
+                quant_ids_by_ml[ml_id].append(quant_id)
+        quants_by_ml = {
+            ml: Quant.browse(quant_ids_by_ml[ml.id]).with_prefetch(quants._prefetch_ids)
+            for ml in self
+        }
+        return quants, quants_by_ml
 
     def reset_move_line_data(self):
         """Resets the move_line data for location destination, quantity done, done datetime and
@@ -385,9 +429,12 @@ class StockMoveLine(models.Model):
             # Set to empty list to bypass the for
             product_ids = []
 
+        products_by_barcode = Product.get_by_barcodes([prod["barcode"] for prod in product_ids])
         for prod in product_ids:
             product_barcode = prod["barcode"]
-            product = Product.get_by_barcode(product_barcode)
+            product = products_by_barcode[
+                tuple(product_barcode) if isinstance(product_barcode, list) else product_barcode
+            ]
             rounding = product.uom_id.rounding
             quantity = prod["uom_qty"]
             # Using get as depending on picking type config u_use_multiple_measures the measure_qty key will not always
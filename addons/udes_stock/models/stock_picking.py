@@ -6,7 +6,7 @@ from odoo import api, models, fields, _
 from odoo.exceptions import ValidationError, UserError
 from .common import get_next_name
 from odoo.addons.udes_common.models.fields import PreciseDatetime
-from odoo.addons.udes_common.tools import RelFieldOps
+from odoo.addons.udes_common.tools import RelFieldOps, profiled
 from lxml import etree
 from odoo.osv import expression
 from collections import defaultdict
@@ -195,7 +195,25 @@ class StockPicking(models.Model):
 
     @api.depends("move_lines.product_id", "move_lines.product_uom_qty")
     def _compute_total_weight(self):
-        for picking in self:
+        stored_pickings = self._get_stored_pickings()
+        if stored_pickings:
+            self.env["stock.move"].flush(["picking_id", "product_id", "product_uom_qty"])
+            self.env["product.product"].flush(["weight"])
+            self.env.cr.execute(
+                """
+                    SELECT move.picking_id, SUM(move.product_uom_qty * COALESCE(product.weight, 0))
+                    FROM stock_move move
+                    JOIN product_product product ON product.id = move.product_id
+                    WHERE move.picking_id IN %s
+                    GROUP BY move.picking_id
+                """,
+                (tuple(stored_pickings.ids),),
+            )
+            weights = dict(self.env.cr.fetchall())
+            for picking in stored_pickings:
+                picking.u_total_weight = weights.get(picking.id, 0.0)
+
+        for picking in self - stored_pickings:
             picking.u_total_weight = sum(
                 move.product_uom_qty * move.product_id.weight
                 for move in picking.move_lines
@@ -206,7 +224,15 @@ class StockPicking(models.Model):
         """Compute first picking from moves that do not originate from other moves"""
         Move = self.env["stock.move"]
 
-        for picking in self:
+        stored_pickings = self._get_stored_pickings()
+        first_picking_ids = stored_pickings._get_first_picking_ids()
+        for picking in stored_pickings:
+            first_pickings = self.browse(first_picking_ids[picking.id])
+            picking.u_first_picking_ids = first_pickings
+            picking.u_first_pickings_qty = len(first_pickings)
+
+        # Pickings which are not yet saved, e.g. in onchanges, walk the chain in memory
+        for picking in self - stored_pickings:
             first_moves = Move.browse()
 
             moves = picking.move_lines
@@ -218,6 +244,46 @@ class StockPicking(models.Model):
             picking.u_first_picking_ids = first_pickings
             picking.u_first_pickings_qty = len(first_pickings)
 
+    def _get_first_picking_ids(self):
+        """
+        Return a dictionary of the ids of the first pickings of each picking in self,
+        from the moves that do not originate from other moves.
+
+        The move chains of all pickings in self are walked in a single recursive query.
+        """
+        Move = self.env["stock.move"]
+
+        first_picking_ids = defaultdict(list)
+        if not self:
+            return first_picking_ids
+
+        Move.flush(["picking_id", "move_orig_ids"])
+        self.env.cr.execute(
+            """
+                WITH RECURSIVE chain(picking_id, move_id) AS (
+                    SELECT picking_id, id
+                    FROM stock_move
+                    WHERE picking_id IN %s
+                UNION
+                    SELECT chain.picking_id, rel.move_orig_id
+                    FROM chain
+                    JOIN stock_move_move_rel rel ON rel.move_dest_id = chain.move_id
+                )
+                SELECT DISTINCT chain.picking_id, move.picking_id
+                FROM chain
+                JOIN stock_move move ON move.id = chain.move_id
+                WHERE move.picking_id IS NOT NULL
+                AND NOT EXISTS (
+                    SELECT 1 FROM stock_move_move_rel rel WHERE rel.move_dest_id = chain.move_id
+                )
+                ORDER BY chain.picking_id, move.picking_id
+            """,
+            (tuple(self.ids),),
+        )
+        for picking_id, first_picking_id in self.env.cr.fetchall():
+            first_picking_ids[picking_id].append(first_picking_id)
+        return first_picking_ids
+
     @api.depends(
         "move_lines",
         "move_lines.move_orig_ids",
@@ -227,8 +293,10 @@ class StockPicking(models.Model):
     )
     def _compute_related_picking_ids(self):
         """Compute previous/next picking and created backorders"""
+        stored_picking_ids = [picking_id for picking_id in self.ids if isinstance(picking_id, int)]
+        back_orders_by_picking = self._get_created_backorders_by_picking(stored_picking_ids)
         for picking in self:
-            back_orders = self.search([("backorder_id", "=", picking.id)])
+            back_orders = back_orders_by_picking.get(picking.id, self.browse())
             prev_pickings = picking.move_lines.move_orig_ids.picking_id
             next_pickings = picking.move_lines.move_dest_ids.picking_id
 
@@ -239,10 +307,76 @@ class StockPicking(models.Model):
             picking.u_created_backorder_ids = back_orders
             picking.u_back_orders_qty = len(back_orders)
 
+    @api.model
+    def _get_created_backorders_by_picking(self, picking_ids):
+        """Return a dictionary of the backorders created from each of the picking ids"""
+        backorders = self.browse()
+        if picking_ids:
+            backorders = self.search([("backorder_id", "in", picking_ids)])
+        backorder_ids_by_picking = defaultdict(list)
+        for row in backorders.read(["backorder_id"], load="_classic_write"):
+            backorder_ids_by_picking[row["backorder_id"]].append(row["id"])
+        return {
+            picking_id: self.browse(ids).with_prefetch(backorders._prefetch_ids)
+            for picking_id, ids in backorder_ids_by_picking.items()
+        }
+
+    def _get_stored_pickings(self):
+        """Return the pickings in self which are saved, and so can be aggregated in SQL"""
+        return self.filtered(lambda p: isinstance(p.id, int))
+
+    def _get_move_quantities(self):
+        """
+        Return a dictionary of the quantity done and the quantity to do of each
+        non-cancelled move of each picking in self, in the UoM of the move, aggregated
+        from the move lines in a single query.
+        """
+        Uom = self.env["uom.uom"]
+
+        move_quantities = defaultdict(dict)
+        if not self:
+            return move_quantities
+
+        self.env["stock.move"].flush(["picking_id", "state", "product_uom", "product_uom_qty"])
+        self.env["stock.move.line"].flush(["move_id", "product_uom_id", "qty_done"])
+        self.env.cr.execute(
+            """
+                SELECT move.picking_id, move.id, move.product_uom, move.product_uom_qty,
+                    ml.product_uom_id, SUM(ml.qty_done)
+                FROM stock_move move
+                LEFT JOIN stock_move_line ml ON ml.move_id = move.id
+                WHERE move.picking_id IN %s
+                AND move.state != 'cancel'
+                GROUP BY move.picking_id, move.id, ml.product_uom_id
+            """,
+            (tuple(self.ids),),
+        )
+        for row in self.env.cr.fetchall():
+            picking_id, move_id, move_uom_id, qty_todo, ml_uom_id, qty_done = row
+            qty_done = qty_done or 0.0
+            if qty_done and ml_uom_id != move_uom_id:
+                qty_done = Uom.browse(ml_uom_id)._compute_quantity(
+                    qty_done, Uom.browse(move_uom_id), round=False
+                )
+            done, todo = move_quantities[picking_id].get(move_id, (0.0, qty_todo))
+            move_quantities[picking_id][move_id] = (done + qty_done, todo)
+        return move_quantities
+
     @api.depends("move_lines", "move_lines.quantity_done", "move_lines.product_uom_qty")
     def _compute_picking_quantities(self):
         """Compute the quantity done and to do of the picking from the moves"""
-        for picking in self:
+        stored_pickings = self._get_stored_pickings()
+        move_quantities = stored_pickings._get_move_quantities()
+        for picking in stored_pickings:
+            quantities = move_quantities[picking.id].values()
+            picking.u_quantity_done = sum(qty_done for qty_done, _qty_todo in quantities)
+            picking.u_total_quantity = sum(qty_todo for _qty_done, qty_todo in quantities)
+            picking.u_has_discrepancies = any(
+                qty_done != qty_todo for qty_done, qty_todo in quantities
+            )
+
+        # Pickings which are not yet saved, e.g. in onchanges, are summed in memory
+        for picking in self - stored_pickings:
             total_qty_done = 0.0
             total_qty_todo = 0.0
             has_discrepancies = False
@@ -271,7 +405,23 @@ class StockPicking(models.Model):
     @api.depends("move_line_ids", "move_line_ids.result_package_id")
     def _compute_num_pallets(self):
         """Compute the number of pallets from the operations"""
-        for picking in self:
+        stored_pickings = self._get_stored_pickings()
+        if stored_pickings:
+            self.env["stock.move.line"].flush(["picking_id", "result_package_id"])
+            self.env.cr.execute(
+                """
+                    SELECT picking_id, COUNT(DISTINCT result_package_id)
+                    FROM stock_move_line
+                    WHERE picking_id IN %s
+                    GROUP BY picking_id
+                """,
+                (tuple(stored_pickings.ids),),
+            )
+            num_pallets = dict(self.env.cr.fetchall())
+            for picking in stored_pickings:
+                picking.u_num_pallets = num_pallets.get(picking.id, 0)
+
+        for picking in self - stored_pickings:
             picking.u_num_pallets = len(picking.move_line_ids.result_package_id)
 
     def reset_move_lines_from_pack(self):
@@ -793,11 +943,7 @@ class StockPicking(models.Model):
             if picking_types:
                 domain.append(("picking_type_id", "in", picking_types.ids))
 
-        while True:
-            records = self.search(domain, limit=limit)
-            if not records:
-                break
-            yield records
+        yield from self.search_iter(domain, batch_size=limit)
 
     def unlink_empty(self):
         """
@@ -981,6 +1127,7 @@ class StockPicking(models.Model):
         )
         return res
 
+    @profiled("stock.picking.validate_picking")
     def validate_picking(self, create_backorder=False, force_validate=False):
         """Validates a picking and returns its backorder if any has been created.
         Will raise an error if create_backorder is False and there are incomplete lines.
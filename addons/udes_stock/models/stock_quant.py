@@ -125,6 +125,30 @@ class StockQuant(models.Model):
         )
         return available_quantity
 
+    @api.model
+    def get_available_quantities(self, products, locations):
+        """Get available quantity of each of products within locations.
+
+        The quantities are summed up by a single grouped query, rather than
+        a search per product as with get_available_quantity.
+
+        :returns: a dictionary with the available quantity mapped by product,
+            including a zero quantity for products without any stock
+        """
+        Product = self.env["product.product"]
+
+        quantities = dict.fromkeys(products, 0)
+        if not products:
+            return quantities
+        domain = self.get_available_qty_domain(products, locations)
+        groups = self.read_group(
+            domain, ["product_id", "quantity", "reserved_quantity"], ["product_id"], lazy=False
+        )
+        for group in groups:
+            product = Product.browse(group["product_id"][0])
+            quantities[product] = group["quantity"] - group["reserved_quantity"]
+        return quantities
+
     def get_move_lines(self, aux_domain=None):
         """Get the move lines associated with a quant
         :param aux_domain: Extra domain arguments to add to the search
@@ -156,8 +180,8 @@ class StockQuant(models.Model):
         return domain
 
     @api.model
-    def get_available_qty_domain(self, product, locations):
-        return [("product_id", "=", product.id), ("location_id", "child_of", locations.ids)]
+    def get_available_qty_domain(self, products, locations):
+        return [("product_id", "in", products.ids), ("location_id", "child_of", locations.ids)]
 
     def _update_available_quantity(
         self,
@@ -103,6 +103,13 @@ class StockWarehouse(models.Model):
                           " \n %s") % ", ".join(products.mapped("display_name"))
                     )
 
+    def write(self, vals):
+        """Extend write to clear the cached products by barcode when changing barcode configuration"""
+        res = super().write(vals)
+        if "u_product_multiple_barcodes" in vals:
+            self.env["product.product"]._clear_barcode_cache()
+        return res
+
     def get_picking_types(self):
         """Returns a recordset with the picking_types of the warehouse"""
         PickingType = self.env["stock.picking.type"]
@@ -156,3 +156,50 @@ class TestMixinModel(BaseUDES):
             e.exception.args[0],
             "Too many Procurement Groups found for identifier TESTGROUP01 in procurement.group",
         )
+
+    def test_get_or_create_many(self):
+        """Get many products by name, barcode and id at once"""
+        products = self.Product.get_or_create_many(
+            ["Test product Apple", "productBanana", self.cherry.id]
+        )
+        self.assertEqual(
+            products,
+            {
+                "Test product Apple": self.apple,
+                "productBanana": self.banana,
+                self.cherry.id: self.cherry,
+            },
+        )
+
+    def test_get_or_create_many_creates_missing(self):
+        """Create only the groups which are not found"""
+        group = self.Group.get_or_create("TESTGROUP01", create=True)
+        groups = self.Group.get_or_create_many(["TESTGROUP01", "TESTGROUP02"], create=True)
+        self.assertEqual(groups["TESTGROUP01"], group)
+        self.assertEqual(groups["TESTGROUP02"].name, "TESTGROUP02")
+        self.assertEqual(
+            self.Group.search([("name", "in", ["TESTGROUP01", "TESTGROUP02"])]),
+            group | groups["TESTGROUP02"],
+        )
+
+    def test_get_or_create_many_not_found(self):
+        """Error raised when any identifier is not found, unless returning empty results"""
+        with self.assertRaises(ValidationError) as e:
+            self.Product.get_or_create_many(["Test product Apple", "Invisible Apple"])
+        self.assertEqual(e.exception.args[0], "Product not found for identifier Invisible Apple")
+
+        products = self.Product.get_or_create_many(
+            ["Test product Apple", "Invisible Apple"], return_empty=True
+        )
+        self.assertEqual(products["Test product Apple"], self.apple)
+        self.assertFalse(products["Invisible Apple"])
+
+    def test_get_or_create_many_multiple_instances(self):
+        """Error raised when an identifier matches more than one group"""
+        self.Group.create([{"name": "TESTGROUP01"}, {"name": "TESTGROUP01"}])
+        with self.assertRaises(ValidationError) as e:
+            self.Group.get_or_create_many(["TESTGROUP01"])
+        self.assertEqual(
+            e.exception.args[0],
+            "Too many Procurement Groups found for identifier TESTGROUP01 in procurement.group",
+        )
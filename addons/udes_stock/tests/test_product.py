@@ -57,6 +57,56 @@ class TestProductAllowedTrackingValues(BaseUDES):
         product = self.Product.get_by_barcode(strawberry_barcode)
         self.assertEqual(self.strawberry, product)
 
+    def test_get_product_from_changed_barcode(self):
+        """Test that cached products by barcode are updated when a product barcode changes."""
+        self.assertEqual(self.Product.get_by_barcode("productStrawberry"), self.strawberry)
+        self.assertFalse(self.Product.get_by_barcode("newStrawberry"))
+        self.strawberry.barcode = "newStrawberry"
+        self.assertFalse(self.Product.get_by_barcode("productStrawberry"))
+        self.assertEqual(self.Product.get_by_barcode("newStrawberry"), self.strawberry)
+
+    def test_get_product_from_barcode_and_barcodes_match(self):
+        """Test that getting products from one barcode at a time matches getting them all at once,
+        including products the user cannot read."""
+        other_company = self.create_company("Other Company")
+        self.apple.company_id = other_company
+        user = self.create_user("Barcode User", "barcode_user")
+        Product = self.Product.with_user(user)
+        barcodes = [self.strawberry.barcode, self.apple.barcode, "invisibleApple"]
+
+        products = Product.get_by_barcodes(barcodes)
+
+        self.assertEqual(products, {barcode: Product.get_by_barcode(barcode) for barcode in barcodes})
+        self.assertEqual(products[self.strawberry.barcode], self.strawberry)
+        self.assertFalse(products[self.apple.barcode])
+
+    def test_get_product_from_reassigned_barcode(self):
+        """Test that cached products by barcode are updated when a barcode moves to another product,
+        and when a product is archived."""
+        barcode = self.strawberry.barcode
+        self.assertEqual(self.Product.get_by_barcode(barcode), self.strawberry)
+        self.strawberry.barcode = "oldStrawberry"
+        self.apple.barcode = barcode
+        self.assertEqual(self.Product.get_by_barcode(barcode), self.apple)
+        self.assertEqual(self.Product.get_by_barcodes([barcode, "oldStrawberry"])[barcode], self.apple)
+
+        self.apple.active = False
+        self.assertFalse(self.Product.get_by_barcode(barcode))
+
+    def test_get_products_from_many_barcodes(self):
+        """Test getting the products of many barcodes at once."""
+        products = self.Product.get_by_barcodes(
+            [self.strawberry.barcode, self.apple.barcode, "invisibleApple", self.apple.barcode]
+        )
+        self.assertEqual(
+            products,
+            {
+                self.strawberry.barcode: self.strawberry,
+                self.apple.barcode: self.apple,
+                "invisibleApple": self.Product.browse(),
+            },
+        )
+
 
 class TestProductMultiBarcodes(BaseUDES):
 
@@ -93,6 +143,29 @@ class TestProductMultiBarcodes(BaseUDES):
                 product = self.Product.get_by_barcode(barcodes)
                 self.assertEqual(product, self.strawberry)
 
+    def test_get_products_from_many_barcodes(self):
+        """Test getting the products of many barcodes at once when the multi barcodes config is enabled."""
+        self.add_product_barcodes(self.strawberry, ["bar-strawberry", "strawberry"])
+        self.add_product_barcodes(self.apple, ["apple"])
+        products = self.Product.get_by_barcodes(
+            [["bar-strawberry", "strawberry"], "apple", self.apple.barcode]
+        )
+        self.assertEqual(
+            products,
+            {
+                ("bar-strawberry", "strawberry"): self.strawberry,
+                "apple": self.apple,
+                self.apple.barcode: self.Product.browse(),
+            },
+        )
+
+    def test_get_product_from_removed_barcode(self):
+        """Test that cached products by barcode are updated when a barcode is removed."""
+        self.add_product_barcodes(self.strawberry, ["strawberry"])
+        self.assertEqual(self.Product.get_by_barcode("strawberry"), self.strawberry)
+        self.strawberry.u_barcode_ids.unlink()
+        self.assertFalse(self.Product.get_by_barcode("strawberry"))
+
     def test_get_add_new_barcode(self):
         """
         Testing adding new barcodes will update the list of barcodes as expected.
@@ -250,6 +250,47 @@ class TestLocationCountable(BaseUDES):
         # Assert itself and its children are not countable
         self.assert_locations_not_countable(self.get_location_with_children(self.countable_zone_a))
 
+    def test_get_nearest_ancestors(self):
+        """Check the nearest matching ancestor is found for each location"""
+        self.countable_zone_a.u_location_is_countable = "no"
+        locations = (
+            self.countable_zone
+            | self.countable_zone_a
+            | self.countable_location_a1
+            | self.uncountable_location_a1
+        )
+        nearest_ancestors = locations._get_nearest_ancestors(
+            [("u_location_is_countable", "in", ("yes", "no"))]
+        )
+        self.assertFalse(nearest_ancestors[self.countable_zone])
+        self.assertEqual(nearest_ancestors[self.countable_zone_a], self.countable_zone)
+        self.assertEqual(nearest_ancestors[self.countable_location_a1], self.countable_zone_a)
+        self.assertEqual(nearest_ancestors[self.uncountable_location_a1], self.uncountable_zone)
+
+    def test_get_nearest_ancestors_includes_archived_locations(self):
+        """Check an archived ancestor is matched, as when following the parent location"""
+        zone = self.create_location("Archive Zone", usage="view", u_location_is_countable="yes")
+        zone_a = self.create_location(
+            "Archive Zone A", usage="view", location_id=zone.id, u_location_is_countable="no"
+        )
+        location_a1 = self.create_location("Archive Location A1", location_id=zone_a.id)
+        zone_a.active = False
+
+        nearest_ancestors = location_a1._get_nearest_ancestors(
+            [("u_location_is_countable", "in", ("yes", "no"))]
+        )
+        self.assertEqual(nearest_ancestors[location_a1], zone_a)
+
+    def test_get_nearest_ancestors_of_moved_location(self):
+        """Check the nearest ancestor follows a change of parent not yet flushed"""
+        location_a1 = self.countable_location_a1
+        location_a1.location_id = self.uncountable_zone
+
+        nearest_ancestors = location_a1._get_nearest_ancestors(
+            [("u_location_is_countable", "in", ("yes", "no"))]
+        )
+        self.assertEqual(nearest_ancestors[location_a1], self.uncountable_zone)
+
 
 class TestInternalLocationChildrenConstraint(BaseUDES):
     @classmethod
@@ -250,6 +250,43 @@ class TestStockMoveLine(common.BaseUDES):
             sum(quants.filtered(lambda q: q.product_id == self.banana).mapped("quantity")) == 5
         )
 
+    def test_get_quants_by_move_line(self):
+        """Check get_quants_by_move_line matches each move line to its own quants"""
+        test_package = self.create_package()
+        apple_quant = self.create_quant(
+            self.apple.id, self.test_stock_location_01.id, 10, package_id=test_package.id
+        )
+        banana_quant = self.create_quant(self.banana.id, self.test_stock_location_02.id, 5)
+        # Quants in other locations and packages are not matched
+        self.create_quant(self.apple.id, self.test_stock_location_02.id, 10)
+        self.create_quant(self.banana.id, self.test_stock_location_01.id, 5)
+        pick = self.create_picking(
+            self.picking_type_pick,
+            products_info=[
+                {"product": self.apple, "uom_qty": 10},
+                {"product": self.banana, "uom_qty": 5},
+            ],
+            assign=True,
+            confirm=True,
+        )
+        # The first quant created of each product is reserved
+        apple_ml = pick.move_line_ids.filtered(lambda ml: ml.product_id == self.apple)
+        banana_ml = pick.move_line_ids.filtered(lambda ml: ml.product_id == self.banana)
+        self.assertEqual(apple_ml.package_id, test_package)
+        self.assertEqual(banana_ml.location_id, self.test_stock_location_02)
+
+        quants, quants_by_ml = pick.move_line_ids.get_quants_by_move_line()
+        self.assertEqual(quants, apple_quant | banana_quant)
+        self.assertEqual(quants_by_ml, {apple_ml: apple_quant, banana_ml: banana_quant})
+        self.assertEqual(pick.move_line_ids.get_quants(), quants)
+
+    def test_get_quants_by_move_line_empty(self):
+        """Check get_quants_by_move_line of no move lines is empty"""
+        MoveLine = self.env["stock.move.line"]
+        quants, quants_by_ml = MoveLine.get_quants_by_move_line()
+        self.assertFalse(quants)
+        self.assertEqual(quants_by_ml, {})
+
     def test_move_line_for_qty_simple(self):
         """Check move_lines_for_qty returns the move line if satisfied straightaway"""
         # Get apple move line from default goods in picking
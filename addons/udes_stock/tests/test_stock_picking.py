@@ -1399,6 +1399,31 @@ class TestStockPicking(TestStockPickingCommon):
             f"expected backorder: {expected_backorder}",
         )
 
+    def test_assert_created_backorders_computed_for_multiple_pickings(self):
+        """Assert that Created Backorders are computed correctly for several pickings at once"""
+        self.create_quant(self.apple.id, self.test_stock_location_01.id, 1)
+        self.create_quant(self.banana.id, self.test_stock_location_01.id, 1)
+        picks = self.Picking.browse()
+        for product in (self.apple, self.banana):
+            pick = self.create_picking(
+                self.picking_type_pick,
+                products_info=[{"product": product, "uom_qty": 2}],
+                location_dest_id=self.test_received_location_01.id,
+                location_id=self.test_stock_location_01.id,
+                assign=True,
+            )
+            pick.move_line_ids.qty_done = 1
+            pick._action_done()
+            picks |= pick
+
+        picks.invalidate_cache(["u_created_backorder_ids", "u_back_orders_qty"])
+        for pick in picks:
+            expected_backorder = self.Picking.search([("backorder_id", "=", pick.id)])
+            self.assertEqual(len(expected_backorder), 1)
+            self.assertEqual(pick.u_created_backorder_ids, expected_backorder)
+            self.assertEqual(pick.u_back_orders_qty, 1)
+            self.assertFalse(expected_backorder.u_created_backorder_ids)
+
     def test_assert_picking_quantities_computed_correctly(self):
         """Assert that qty todo/done and package discrepancies fields are computed correctly"""
         apple_qty = 10
@@ -1446,6 +1471,36 @@ class TestStockPicking(TestStockPickingCommon):
         self.assertEqual(pick.u_quantity_done, apple_qty)
         self.assertFalse(pick.u_has_discrepancies)
 
+    def test_assert_weight_and_pallets_computed_for_multiple_pickings(self):
+        """Assert that total weight and number of pallets are computed correctly for
+        several pickings at once"""
+        self.apple.weight = 0.5
+        self.banana.weight = 2
+        self.create_quant(self.apple.id, self.test_stock_location_01.id, 10)
+        self.create_quant(self.banana.id, self.test_stock_location_01.id, 10)
+        apple_pick = self.create_picking(
+            self.picking_type_pick,
+            products_info=[{"product": self.apple, "uom_qty": 4}],
+            assign=True,
+        )
+        mixed_pick = self.create_picking(
+            self.picking_type_pick,
+            products_info=[
+                {"product": self.apple, "uom_qty": 2},
+                {"product": self.banana, "uom_qty": 3},
+            ],
+            assign=True,
+        )
+        pallet = self.create_package()
+        mixed_pick.move_line_ids.write({"result_package_id": pallet.id})
+
+        picks = apple_pick | mixed_pick
+        picks.invalidate_cache(["u_total_weight", "u_num_pallets"])
+        self.assertEqual(apple_pick.u_total_weight, 2)
+        self.assertEqual(mixed_pick.u_total_weight, 7)
+        self.assertEqual(apple_pick.u_num_pallets, 0)
+        self.assertEqual(mixed_pick.u_num_pallets, 1)
+
 
 class TestDifferentUoMinPickings(TestStockPickingCommon):
     @classmethod
@@ -1477,6 +1532,23 @@ class TestDifferentUoMinPickings(TestStockPickingCommon):
             {"product": self.banana, "uom_qty": 6, "uom_id": uom_id},
         ]
 
+    def test_move_quantities_converted_to_move_uom(self):
+        """Assert that the quantity done of a move line in a different UoM to its move
+        is converted to the UoM of the move"""
+        uom_unit = self.env.ref("uom.product_uom_unit")
+        pick = self.create_picking(
+            self.picking_type_goods_in,
+            products_info=[{"product": self.cherry, "uom_qty": 1}],
+            confirm=True,
+        )
+        move = pick.move_lines
+        self.assertEqual(move.product_uom, self.uom_dozen)
+        self.create_move_line(move, 0, uom_id=uom_unit.id, qty_done=6)
+
+        move_quantities = pick._get_move_quantities()
+        self.assertEqual(move_quantities[pick.id][move.id], (0.5, 1))
+        self.assertEqual(pick.u_quantity_done, 0.5)
+
     def test_move_created_with_two_move_lines_and_default_uom(self):
         """
         Prepare and create multiple moves with different UoMs.
@@ -2150,3 +2222,30 @@ class TestStockPickingFloatQty(TestStockPickingCommon):
         self.assertEqual(sorted(picking.move_line_ids.mapped("lot_name")), lot_names)
         self.assertEqual(picking.move_line_ids.mapped("product_uom_qty"), [0.0] * 12) #0.0 
         self.assertEqual(picking.move_line_ids.mapped("qty_done"), lot_quantities)    #0.1
+
+
+class TestStockPickingDetailedView(common.BaseUDES):
+    """Tests for hiding the detailed view fields of the picking form view"""
+
+    def test_detailed_view_fields_hidden(self):
+        """Detailed view fields are removed from the form view, unless viewing all fields,
+        in which case the view more button is removed instead"""
+        Picking = self.env["stock.picking"]
+
+        arch = Picking.fields_view_get(view_type="form")["arch"]
+        self.assertNotIn(b'name="u_prev_picking_ids"', arch)
+        self.assertIn(b'name="action_detailed_view"', arch)
+
+        arch = Picking.with_context(view_all_fields=True).fields_view_get(view_type="form")["arch"]
+        self.assertIn(b'name="u_prev_picking_ids"', arch)
+        self.assertNotIn(b'name="action_detailed_view"', arch)
+
+    def test_detailed_view_arch_cached(self):
+        """The processed arch is only computed once for the same view"""
+        Picking = self.env["stock.picking"]
+
+        Picking.fields_view_get(view_type="form")
+        with patch("odoo.addons.udes_common.models.models.etree.XML") as xml:
+            arch = Picking.fields_view_get(view_type="form")["arch"]
+            xml.assert_not_called()
+        self.assertNotIn(b'name="u_prev_picking_ids"', arch)
@@ -69,6 +69,21 @@ class TestStockQuantModel(BaseUDES):
             ),
         )
 
+    def test_get_available_quantities(self):
+        """Test get_available_quantities matches get_available_quantity per product"""
+        products = self.apple | self.banana | self.cherry
+        self.quantA.reserved_quantity = 5
+        quantities = self.Quant.get_available_quantities(products, self.test_stock_location_01)
+        self.assertEqual(quantities, {self.apple: 11, self.banana: 10, self.cherry: 0})
+        for product in products:
+            self.assertEqual(
+                quantities[product],
+                self.Quant.get_available_quantity(product, self.test_stock_location_01),
+            )
+        # Child locations are included
+        quantities = self.Quant.get_available_quantities(products, self.stock_location)
+        self.assertEqual(quantities, {self.apple: 11, self.banana: 20, self.cherry: 0})
+
     def test_gather_success(self):
         """Test extended _gather function"""
         gathered_items = self.Quant._gather(self.apple, self.test_stock_location_01)
@@ -2,7 +2,7 @@ from collections import defaultdict
 
 from odoo import models, _
 from odoo.exceptions import UserError
-from odoo.addons.udes_common.tools import odoo_retry
+from odoo.addons.udes_common.tools import RetryPolicy, odoo_retry, profiled
 
 import logging
 
@@ -58,18 +58,21 @@ class StockPicking(models.Model):
                     ["product_id", "product_uom_qty", "state"], load="_classic_write"
                 )
 
+                # Get the available stock of all products new to this batch at once
+                products = batched_pickings.move_lines.filtered(
+                    lambda m: m.state not in skip_states
+                ).product_id
+                new_products = products.filtered(lambda p: p not in stock_for_products)
+                stock_for_products.update(
+                    Quant.get_available_quantities(new_products, location)
+                )
+
                 for picking in batched_pickings:
                     # Loop moves and deduct from stock_for_products dict
                     # If this code is modified, the caching above needs to be
                     # kept up to date to ensure good performance
                     for move in picking.move_lines.filtered(lambda m: m.state not in skip_states):
                         product = move.product_id
-
-                        if product not in stock_for_products.keys():
-                            stock_for_products[product] = Quant.get_available_quantity(
-                                product,
-                                location,
-                            )
                         qty_ordered = move.product_uom_qty
                         if stock_for_products[product] <= 0 or (
                             stock_for_products[product] < qty_ordered
@@ -82,6 +85,7 @@ class StockPicking(models.Model):
 
         return unreservable_moves
 
+    @profiled("stock.picking.reserve_stock")
     def reserve_stock(self, batch_size=100):
         """
         Reserve stock according to the number of reservable pickings.
@@ -145,21 +149,36 @@ class StockPicking(models.Model):
 
             If self is empty, we yield one by one all pickings which are not processed,
             as we can not assume they are from the same batch.
+            The confirmed pickings are searched once in priority order and streamed in pages
+            of batch_size, skipping processed pickings in memory rather than excluding them in
+            the search. The search is repeated once exhausted, to pick up pickings confirmed in
+            the meantime, until it yields nothing new.
             """
-            while True:
-                if using_wizard:
+            if using_wizard:
+                while True:
                     yield self.filtered(lambda p: p.picking_type_id == picking_type) - processed
-                else:
-                    domain = [
-                        ("picking_type_id", "=", picking_type.id),
-                        ("state", "=", "confirmed"),
-                    ]
-                    if processed:
-                        domain.append(("id", "not in", processed.ids))
-                    pickings = Picking.search(domain, limit=batch_size)
-                    if not pickings:
-                        break
-                    yield from pickings
+            domain = [
+                ("picking_type_id", "=", picking_type.id),
+                ("state", "=", "confirmed"),
+            ]
+            while True:
+                yielded = False
+                pages = Picking.search_iter(domain, batch_size=batch_size, order=Picking._order)
+                for page in pages:
+                    for picking in page:
+                        # Pickings may have been processed since the page was fetched
+                        if picking.id in processed_ids or picking.state != "confirmed":
+                            continue
+                        yielded = True
+                        yield picking
+                if not yielded:
+                    break
+
+        def add_processed(pickings):
+            """Add pickings to the processed pickings, tracking their ids"""
+            nonlocal processed
+            processed |= pickings
+            processed_ids.update(pickings.ids)
 
         Picking = self.env["stock.picking"]
         # Reserve batches 'atomically' i.e reserve pickings until all pickings in a batch have
@@ -168,6 +187,11 @@ class StockPicking(models.Model):
         # if the batch can not be completely reserved.
         to_reserve = picking_type.u_num_reservable_pickings
         processed = Picking.browse()
+        processed_ids = set()
+        # Back off exponentially, with jitter, so colliding workers don't retry in lockstep
+        retry_policy = RetryPolicy(
+            "stock.picking.reserve_stock", max_tries=MAX_TRIES_ON_CONCURRENCY_FAILURE
+        )
 
         pickings_to_reserve = generate_pickings()
         # Reserve stock until there is none left to reserve (or -1 - reserve all)
@@ -185,7 +209,7 @@ class StockPicking(models.Model):
             extended_processed_pickings = pickings.add_processed_pickings(processed)
             # If have been added more processed pickings, continue the loop without trying to reserve the pickings
             if extended_processed_pickings != processed:
-                processed = extended_processed_pickings
+                add_processed(extended_processed_pickings)
                 continue
 
             # Pre-pass to remove unprocessable pickings
@@ -197,14 +221,14 @@ class StockPicking(models.Model):
                 )
                 if not picking_type.u_handle_partials:
                     # Add to processed to skip reservation.
-                    processed |= pickings
+                    add_processed(pickings)
 
                     if using_wizard:
                         self.raise_insufficiency_error(unreservable_moves)
                     continue
                 elif not moves_todo:
                     # Add to processed to skip reservation.
-                    processed |= pickings
+                    add_processed(pickings)
                     continue
 
             # Actually reserve the stock, inside a retry loop to handle potential concurrency issues
@@ -215,12 +239,13 @@ class StockPicking(models.Model):
                 pickings._process_pickings,
                 MAX_TRIES_ON_CONCURRENCY_FAILURE,
                 raise_usererrors=using_wizard,
+                policy=retry_policy,
             )()
             tries = data.get("tries")
             newly_processed = data.get("newly_processed")
             if newly_processed:
-                processed |= newly_processed
-            processed |= pickings
+                add_processed(newly_processed)
+            add_processed(pickings)
             if tries == -1:
                 continue
             if tries >= MAX_TRIES_ON_CONCURRENCY_FAILURE:
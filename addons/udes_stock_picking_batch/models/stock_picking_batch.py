@@ -1,10 +1,12 @@
 import logging
-from itertools import chain
+from itertools import islice
 
 from odoo import models, fields, _, api
 from odoo.exceptions import UserError, ValidationError
 from .common import PRIORITIES
+from .task_planner import TaskPlanner, task_grouping_key
 from odoo.addons.udes_stock.models.common import get_next_name
+from odoo.addons.udes_common.tools import profiled
 
 from ...udes_stock.utils import UDES_STATISTICS_LOG_FORMAT
 
@@ -503,26 +505,36 @@ class StockPickingBatch(models.Model):
             # but still needs more access rights for the flow
             self.sudo().write({"u_last_reserved_pallet_name": pallet_name})
 
-    def _get_task_grouping_criteria(self):
+    def _get_task_grouping_fields(self):
         """
-        Return a function for sorting by picking, package(maybe), product, and
-        location. The package is not included if the picking type allows for
-        the swapping of packages (`u_allow_swapping_packages`) and picks by
-        product (`u_user_scans`)
+        Return the move line fields for sorting by picking, package(maybe),
+        location, product and lot(maybe). The package is not included if the
+        picking type allows for the swapping of packages
+        (`u_allow_swapping_packages`) and picks by product (`u_user_scans`)
         """
         batch_pt = self.picking_type_id
 
-        parts = [lambda ml: (ml.picking_id.id,)]
+        field_names = ["picking_id"]
 
         if not (batch_pt.u_allow_swapping_packages and batch_pt.u_user_scans == "product"):
-            parts.append(lambda ml: (ml.package_id.id,))
+            field_names.append("package_id")
 
-        parts.append(lambda ml: (ml.location_id.id, ml.product_id.id))
+        field_names.extend(["location_id", "product_id"])
 
         if batch_pt.u_user_scans == "product" and not batch_pt.u_allow_swapping_tracked_products:
-            parts.append(lambda ml: (ml.lot_id.id,))
+            field_names.append("lot_id")
 
-        return lambda ml: tuple(chain(*[part(ml) for part in parts]))
+        return tuple(field_names)
+
+    def _get_task_grouping_criteria(self):
+        """
+        Return a function for sorting by picking, package(maybe), product, and
+        location, as given by _get_task_grouping_fields.
+
+        The function is compiled once per set of fields, and groups whole sets
+        of move lines on the raw ids of the fields when used by the task planner.
+        """
+        return task_grouping_key(self._get_task_grouping_fields())
 
     def get_available_move_lines(self):
         """Get all the move lines from available pickings"""
@@ -544,6 +556,7 @@ class StockPickingBatch(models.Model):
 
         return skipped_mls
 
+    @profiled("stock.picking.batch.get_next_tasks")
     def get_next_tasks(
         self,
         skipped_product_ids=None,
@@ -652,6 +665,25 @@ class StockPickingBatch(models.Model):
         )
         return completed_tasks
 
+    def _get_task_planner(
+        self,
+        move_lines,
+        task_grouping_criteria=None,
+        skipped_product_ids=None,
+        skipped_move_line_ids=None,
+    ):
+        """Return a planner which groups and orders the move lines once and
+        then hands out their tasks in order"""
+        if task_grouping_criteria is None:
+            task_grouping_criteria = self._get_task_grouping_criteria()
+        return TaskPlanner(
+            self,
+            move_lines,
+            task_grouping_criteria,
+            skipped_product_ids=skipped_product_ids,
+            skipped_move_line_ids=skipped_move_line_ids,
+        )
+
     def _populate_next_tasks(
         self,
         move_lines,
@@ -662,18 +694,15 @@ class StockPickingBatch(models.Model):
         limit=1,
     ):
         """Populate the next tasks according to the given criteria"""
-        tasks = []
-        while move_lines:
-            # Check if there is a move line to give priority to
-            priority_ml = move_lines._determine_priority_skipped_moveline(
-                skipped_product_ids, skipped_move_line_ids
-            )
-            task = self._populate_next_task(move_lines, task_grouping_criteria, priority_ml)
+        planner = self._get_task_planner(
+            move_lines,
+            task_grouping_criteria=task_grouping_criteria,
+            skipped_product_ids=skipped_product_ids,
+            skipped_move_line_ids=skipped_move_line_ids,
+        )
+        tasks = list(islice(planner, limit or None))
+        for task in tasks:
             task["tasks_picked"] = have_tasks_been_picked
-            tasks.append(task)
-            if limit and len(tasks) >= limit:
-                break
-            move_lines = move_lines.filtered(lambda ml: ml.id not in task["move_line_ids"])
         return tasks
 
     def _populate_next_task(self, move_lines, task_grouping_criteria, priority_ml=False):
@@ -681,51 +710,8 @@ class StockPickingBatch(models.Model):
 
         Optionally specify a priority move line to be in the next task.
         """
-        task = {"num_tasks_to_pick": 0, "move_line_ids": [], "confirmations": []}
-        if not move_lines:
-            return task
-
-        if task_grouping_criteria is None:
-            task_grouping_criteria = self._get_task_grouping_criteria()
-
-        grouped_mls = move_lines.groupby(task_grouping_criteria)
-        _key, task_mls = next(grouped_mls)
-        # Iterate through grouped_mls until we find the group with the
-        # priority move line in it
-        if priority_ml:
-            while priority_ml not in task_mls:
-                _key, task_mls = next(grouped_mls)
-        num_mls = len(task_mls)
-        pick_seq = task_mls[0].picking_id.sequence
-        _logger.debug(
-            _(
-                "Batch '%s': creating a task for %s move line%s; "
-                "the picking sequence of the first move line is %s"
-            ),
-            self.name,
-            num_mls,
-            "" if num_mls == 1 else "s",
-            pick_seq if pick_seq is not False else "not determined",
-        )
-
-        # NB: adding all the MLs state to the task; this is what
-        # ends up in the batch::next response!
-        # HERE: this will break in case we cannot guarantee that all
-        # the move lines of the task belong to the same picking
-        task.update(task_mls._prepare_task_info())
-
-        if task_mls[0].picking_id.picking_type_id.u_user_scans in ["pallet", "package"]:
-            # TODO: check pallets of packages if necessary
-            task["num_tasks_to_pick"] = len(move_lines.package_id)
-            task["move_line_ids"] = move_lines.filtered(
-                lambda ml: ml.package_id == task_mls[0].package_id
-            ).ids
-        else:
-            # NB: adding 1 to consider the group removed by next()
-            task["num_tasks_to_pick"] = len(list(grouped_mls)) + 1
-            task["move_line_ids"] = task_mls.ids
-
-        return task
+        planner = self._get_task_planner(move_lines, task_grouping_criteria=task_grouping_criteria)
+        return planner.next_task(priority_ml=priority_ml)
 
     def _get_move_lines_to_drop_off(self):
         """Getting all move lines of the batch that are ready to drop off"""
@@ -769,6 +755,7 @@ class StockPickingBatch(models.Model):
 
         return {"last": last, "move_line_ids": mls_to_drop.ids, "summary": summary}
 
+    @profiled("stock.picking.batch.drop_off_picked")
     def drop_off_picked(self, continue_batch, move_line_ids, location_barcode, result_package_name):
         """
         Validate the move lines of the batch (expects a singleton) by moving them
@@ -1335,8 +1322,8 @@ class StockPickingBatch(models.Model):
             # Trigger refactor here to allow grouping of pickings by move key on confirm. Need to loop
             # over the pickings from the refactored moves as they might be  in a different picking.
             # No unlinking of the empty pickings is done - this relies on the cron to do the clean up
-            refactored_moves = (
-                to_investigate.exists().move_lines._action_refactor(stage="confirm")
+            refactored_moves = to_investigate.exists().move_lines._action_refactor(
+                stage="confirm", source="unpickable_item"
             )
             pickings_to_investigate = refactored_moves.picking_id
             # Some examples to understand the logic below
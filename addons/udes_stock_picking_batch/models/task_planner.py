@@ -0,0 +1,198 @@
+"""Task planning for picking batches"""
+
+import logging
+from collections import defaultdict
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
+
+from odoo import _
+
+_logger = logging.getLogger(__name__)
+
+
+class TaskGroupingKey(object):
+    """Task grouping key on the raw ids of move line relational fields
+
+    A task grouping key may be called on a move line, like any other task
+    grouping criteria, to get the tuple of ids of the related records.  It
+    may also group a whole set of move lines at once from a single read of
+    those ids, sorting and grouping plain tuples of integers rather than
+    going through the ORM for every move line.
+    """
+
+    def __init__(self, field_names):
+        self.field_names = tuple(field_names)
+
+    def __repr__(self):
+        return "%s(%r)" % (type(self).__name__, self.field_names)
+
+    def __call__(self, ml):
+        return tuple(ml[field_name].id for field_name in self.field_names)
+
+    def group(self, move_lines):
+        """Return the ids of the move lines grouped and ordered by the key"""
+        rows = move_lines.read(list(self.field_names), load="_classic_write")
+        keyed_ids = [
+            (tuple(row[field_name] for field_name in self.field_names), row["id"])
+            for row in rows
+        ]
+        # Stable sort, so the move lines keep their order within each group
+        keyed_ids.sort(key=itemgetter(0))
+        return [
+            [ml_id for _key, ml_id in group]
+            for _key, group in groupby(keyed_ids, key=itemgetter(0))
+        ]
+
+
+@lru_cache()
+def task_grouping_key(field_names):
+    """Return the task grouping key for a tuple of move line field names"""
+    return TaskGroupingKey(field_names)
+
+
+class TaskPlanner(object):
+    """Plan the tasks of a batch from a set of move lines
+
+    The move lines are grouped and ordered by the task grouping
+    criteria exactly once, when the planner is created.  Tasks are then
+    handed out lazily and in order by iterating over the planner, with
+    the move lines of each emitted task dropped from the remaining
+    groups.  This gives the same tasks as repeatedly regrouping the
+    remaining move lines, without re-sorting them for every task.
+
+    The priority move line of each task is always determined by
+    ``_determine_priority_skipped_moveline`` on the remaining move lines,
+    so any customisation of that hook applies.  The remaining move lines
+    are kept in their original order as they are consumed, so they are
+    not rescanned from the whole set for every task.
+    """
+
+    def __init__(
+        self,
+        batch,
+        move_lines,
+        task_grouping_criteria,
+        skipped_product_ids=None,
+        skipped_move_line_ids=None,
+    ):
+        self.batch = batch
+        self.move_lines = move_lines
+        self.skipped_product_ids = skipped_product_ids
+        self.skipped_move_line_ids = skipped_move_line_ids
+
+        # Groups of move line ids, in task order
+        if isinstance(task_grouping_criteria, TaskGroupingKey):
+            self.groups = task_grouping_criteria.group(move_lines)
+        else:
+            self.groups = [mls.ids for _key, mls in move_lines.groupby(task_grouping_criteria)]
+        self.group_of = {ml_id: index for index, ids in enumerate(self.groups) for ml_id in ids}
+        self.group_sizes = [len(ids) for ids in self.groups]
+        self.num_groups = len(self.groups)
+        self.first_group = 0
+
+        # Move line ids by package, in the order of the move lines
+        self.package_mls = defaultdict(list)
+        for ml in move_lines:
+            self.package_mls[ml.package_id.id].append(ml.id)
+        self.package_sizes = {
+            package_id: len(ids) for package_id, ids in self.package_mls.items()
+        }
+        self.num_packages = len([package_id for package_id in self.package_sizes if package_id])
+
+        # Remaining move line ids, in the order of the move lines
+        self.remaining = dict.fromkeys(move_lines.ids)
+
+    def __iter__(self):
+        while self.remaining:
+            yield self.next_task()
+
+    def _remaining_move_lines(self):
+        """Remaining move lines, in their original order"""
+        return self.move_lines.browse(list(self.remaining)).with_prefetch(
+            self.move_lines._prefetch_ids
+        )
+
+    def _priority_move_line(self):
+        """Move line to give priority to, if any"""
+        return self._remaining_move_lines()._determine_priority_skipped_moveline(
+            self.skipped_product_ids, self.skipped_move_line_ids
+        )
+
+    def _count_groups_from(self, index):
+        """Number of groups with remaining move lines from index onwards"""
+        if index == self.first_group:
+            return self.num_groups
+        return len([size for size in self.group_sizes[index:] if size])
+
+    def _consume(self, ml_ids):
+        """Drop move lines from the remaining groups and packages"""
+        consumed = [ml_id for ml_id in dict.fromkeys(ml_ids) if ml_id in self.remaining]
+        for ml in self.move_lines.browse(consumed):
+            del self.remaining[ml.id]
+            index = self.group_of[ml.id]
+            self.group_sizes[index] -= 1
+            if not self.group_sizes[index]:
+                self.num_groups -= 1
+            package_id = ml.package_id.id
+            self.package_sizes[package_id] -= 1
+            if package_id and not self.package_sizes[package_id]:
+                self.num_packages -= 1
+        while self.first_group < len(self.groups) and not self.group_sizes[self.first_group]:
+            self.first_group += 1
+
+    def next_task(self, priority_ml=None):
+        """Populate the next task from the remaining move lines
+
+        Optionally specify a priority move line to be in the next task,
+        otherwise it is determined from the skipped products or move
+        lines given to the planner.
+        """
+        task = {"num_tasks_to_pick": 0, "move_line_ids": [], "confirmations": []}
+        if not self.remaining:
+            return task
+
+        if priority_ml is None:
+            priority_ml = self._priority_move_line()
+        if priority_ml:
+            index = self.group_of[priority_ml.id]
+        else:
+            index = self.first_group
+        task_mls = self.move_lines.browse(
+            ml_id for ml_id in self.groups[index] if ml_id in self.remaining
+        )
+
+        num_mls = len(task_mls)
+        pick_seq = task_mls[0].picking_id.sequence
+        _logger.debug(
+            _(
+                "Batch '%s': creating a task for %s move line%s; "
+                "the picking sequence of the first move line is %s"
+            ),
+            self.batch.name,
+            num_mls,
+            "" if num_mls == 1 else "s",
+            pick_seq if pick_seq is not False else "not determined",
+        )
+
+        # NB: adding all the MLs state to the task; this is what
+        # ends up in the batch::next response!
+        # HERE: this will break in case we cannot guarantee that all
+        # the move lines of the task belong to the same picking
+        task.update(task_mls._prepare_task_info())
+
+        if task_mls[0].picking_id.picking_type_id.u_user_scans in ["pallet", "package"]:
+            # TODO: check pallets of packages if necessary
+            task["num_tasks_to_pick"] = self.num_packages
+            task["move_line_ids"] = [
+                ml_id
+                for ml_id in self.package_mls[task_mls[0].package_id.id]
+                if ml_id in self.remaining
+            ]
+        else:
+            # Only groups from the task's group onwards are counted
+            task["num_tasks_to_pick"] = self._count_groups_from(index)
+            task["move_line_ids"] = task_mls.ids
+
+        self._consume(task["move_line_ids"])
+        return task
@@ -1,4 +1,5 @@
 import unittest
+from unittest.mock import patch
 
 from odoo.addons.udes_stock.tests import common
 from odoo.exceptions import ValidationError
@@ -758,6 +759,54 @@ class TestBatchGetNextTask(common.BaseUDES):
         # The second task should be for package '2'
         self.assertEqual(tasks[1]["package_id"]["name"], "00002")
 
+    def test_task_grouping_criteria_groups_on_raw_ids(self):
+        """Test that the default task grouping criteria groups move lines on the raw
+        ids of their fields in the same way as grouping by calling it on each move line
+        """
+        criteria = self.batch._get_task_grouping_criteria()
+        move_lines = self.batch.picking_ids.move_line_ids
+        ml = move_lines[0]
+        self.assertEqual(
+            criteria(ml),
+            (ml.picking_id.id, ml.package_id.id, ml.location_id.id, ml.product_id.id),
+        )
+        self.assertEqual(
+            criteria.group(move_lines),
+            [mls.ids for _key, mls in move_lines.groupby(criteria)],
+        )
+
+    def test_get_next_tasks_without_limit(self):
+        """Test that get_next_tasks without a limit returns every move line
+        exactly once, with a decreasing number of tasks left to pick
+        """
+        self.picking_type_pick.u_user_scans = "product"
+        move_lines = self.batch.picking_ids.move_line_ids
+        tasks = self.batch.get_next_tasks(limit=False)
+        self.assertEqual(len(tasks), 2)
+        self.assertEqual([task["num_tasks_to_pick"] for task in tasks], [2, 1])
+        task_move_line_ids = [ml_id for task in tasks for ml_id in task["move_line_ids"]]
+        self.assertCountEqual(task_move_line_ids, move_lines.ids)
+
+    def test_get_next_tasks_always_determines_priority_move_line(self):
+        """Test that the priority move line hook is used for every task, even when
+        nothing has been skipped
+        """
+        self.picking_type_pick.u_user_scans = "product"
+        MoveLine = self.env["stock.move.line"]
+        move_lines = self.batch.picking_ids.move_line_ids
+        last_ml = move_lines.next_task_sort()[-1]
+
+        def last_move_line(mls, skipped_product_ids=None, skipped_move_line_ids=None):
+            return last_ml if last_ml in mls else False
+
+        with patch.object(
+            type(MoveLine), "_determine_priority_skipped_moveline", last_move_line
+        ):
+            tasks = self.batch.get_next_tasks(limit=False)
+        self.assertEqual(tasks[0]["move_line_ids"], last_ml.ids)
+        task_move_line_ids = [ml_id for task in tasks for ml_id in task["move_line_ids"]]
+        self.assertCountEqual(task_move_line_ids, move_lines.ids)
+
     def test_skip_products(self):
         """Test that get_next_task respects skipped products"""
         # Assert that the specified product is not in the next task
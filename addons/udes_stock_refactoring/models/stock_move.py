@@ -1,9 +1,9 @@
 from odoo import api, models, fields, _, tools
 from odoo.exceptions import UserError, ValidationError
 from odoo.tools.float_utils import float_compare, float_is_zero
+from odoo.addons.udes_common.tools import profiled
 from ..registry.refactor import REFACTOR_REGISTRY
 import logging
-import inspect
 
 _logger = logging.getLogger(__name__)
 
@@ -70,10 +70,11 @@ class StockMove(models.Model):
         Refactor all the moves in self. May result in the moves being changed
         and/or their associated pickings being deleted.
         """
-        self._action_refactor()
+        self._action_refactor(source="action_refactor")
         return True
 
-    def _action_refactor(self, stage=None, refactor_action=False):
+    @profiled("stock.move.refactor")
+    def _action_refactor(self, stage=None, refactor_action=False, source=None):
         """
         Refactor moves in self if any exist.
         :param stage: One of confirm|assign|done, if set, filters the moves
@@ -81,6 +82,8 @@ class StockMove(models.Model):
                 - 'confirm': confirmed, waiting
                 - 'assign': assigned, partially_available
                 - 'done': done
+        :param source: Name of what triggered the refactor, for logging.
+            Logged as "unknown" if not set.
 
         Methods doing a refactor are expected to take a single recordset of
         moves on which they will act, and to return the recordset of
@@ -103,18 +106,20 @@ class StockMove(models.Model):
                 lambda m, lam=refactor_lam: lam(m) and STOCK_REFACTOR_STAGES[m.state] == stage
             )
 
-        stack = inspect.stack()
-        caller = next((frame.function for frame in stack[1:6]), "unknown")
-        source = str(caller)
+        log_refactor = _logger.isEnabledFor(logging.INFO)
+        if source is None:
+            source = "unknown"
 
         refactor_moves = moves.filtered(refactor_lam)
 
-        for picking_type, picking_type_moves in refactor_moves.groupby("picking_type_id"):
+        for picking_type, picking_type_moves in refactor_moves.groupby(
+            "picking_type_id", bucket=True
+        ):
             if refactor_action:
                 grouped_picking_type_moves = [("any state", picking_type_moves)]
             else:
                 grouped_picking_type_moves = picking_type_moves.groupby(
-                    lambda m: STOCK_REFACTOR_STAGES[m.state]
+                    lambda m: STOCK_REFACTOR_STAGES[m.state], bucket=True
                 )
             for stage, stage_moves in grouped_picking_type_moves:
                 refactor_class = self._get_refactor_class(picking_type, stage, refactor_action)
@@ -131,7 +136,9 @@ class StockMove(models.Model):
                         # This simplifies refactoring strategies as they do not need to consider
                         # partially reserved moves.
                         # The unreserved stock will stay on the original picking.
-                        for picking, stage_moves_for_picking in stage_moves.groupby("picking_id"):
+                        for picking, stage_moves_for_picking in stage_moves.groupby(
+                            "picking_id", bucket=True
+                        ):
                             mls = stage_moves_for_picking.move_line_ids
                             if stage_moves_for_picking.get_uncovered_moves(mls=mls):
                                 backorder = picking.split_move_lines_to_backorder(
@@ -159,6 +166,8 @@ class StockMove(models.Model):
                         moves -= stage_moves
                         moves |= new_moves
                         
+                    if not log_refactor:
+                        continue
                     move_line_ids = (stage_moves | new_moves).exists().move_line_ids.ids
                     pickings = moves.picking_id
                     picking_info = [f"{pick.id}, {(pick.name)}" for pick in pickings]
@@ -187,7 +196,7 @@ class StockMove(models.Model):
         Module = self.env["ir.module.module"]
 
         res = super(StockMove, self)._action_confirm(*args, **kwargs)
-        post_refactor_moves = res._action_refactor(stage="confirm")
+        post_refactor_moves = res._action_refactor(stage="confirm", source="_action_confirm")
 
         if Module.is_module_installed("mrp") and post_refactor_moves != res:
             raise UserError(
@@ -205,7 +214,7 @@ class StockMove(models.Model):
         """
         res = super(StockMove, self)._action_assign()
 
-        refactored_moves = res._action_refactor(stage="assign")
+        refactored_moves = res._action_refactor(stage="assign", source="_action_assign")
         res = res.exists() | refactored_moves  # exists() gets rid of deleted moves on merge
         return res
 
@@ -219,7 +228,9 @@ class StockMove(models.Model):
         """
         done_moves = super(StockMove, self)._action_done(cancel_backorder=cancel_backorder)
 
-        post_refactor_done_moves = done_moves._action_refactor(stage="validate")
+        post_refactor_done_moves = done_moves._action_refactor(
+            stage="validate", source="_action_done"
+        )
         return post_refactor_done_moves
 
     def group_by_key(self):
@@ -246,9 +257,14 @@ class StockMove(models.Model):
         move_group into it's own picking
         """
         Picking = self.env["stock.picking"]
+        ProcurementGroup = self.env["procurement.group"]
 
         pickings = self.picking_id
 
+        groups = list(groups)
+        procurement_groups = ProcurementGroup.get_or_create_many(
+            [key for key, _move_group in groups], create=True
+        )
         for key, move_group in groups:
             if len(move_group.location_id) > 1 or len(move_group.location_dest_id) > 1:
                 raise UserError(
@@ -263,7 +279,9 @@ class StockMove(models.Model):
 
             values = move_group.picking_id._prepare_extra_info_for_new_picking_for_group(move_group)
 
-            Picking._new_picking_for_group(key, move_group, **values)
+            Picking._new_picking_for_group(
+                key, move_group, group=procurement_groups[key], **values
+            )
 
         empty_picks = pickings.filtered(lambda p: len(p.move_lines) == 0)
         if empty_picks:
@@ -281,11 +299,16 @@ class StockMove(models.Model):
         """
         Move = self.env["stock.move"]
         Picking = self.env["stock.picking"]
+        ProcurementGroup = self.env["procurement.group"]
 
         pickings = self.picking_id
 
         result_moves = Move.browse()
 
+        groups = list(groups)
+        procurement_groups = ProcurementGroup.get_or_create_many(
+            [key for key, _ml_group in groups], create=True
+        )
         for key, ml_group in groups:
             touched_moves = ml_group.move_id
 
@@ -315,7 +338,9 @@ class StockMove(models.Model):
 
             values = group_pickings._prepare_extra_info_for_new_picking_for_group(group_moves)
 
-            Picking._new_picking_for_group(key, group_moves, **values)
+            Picking._new_picking_for_group(
+                key, group_moves, group=procurement_groups[key], **values
+            )
             result_moves |= group_moves
 
         empty_picks = pickings.filtered(lambda p: len(p.move_lines) == 0)
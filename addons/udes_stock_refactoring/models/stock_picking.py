@@ -83,10 +83,12 @@ class StockPicking(models.Model):
                     pack_move_lines.write({"package_level_id": package_level.id})
 
     @api.model
-    def _new_picking_for_group(self, group_key, moves, **kwargs):
+    def _new_picking_for_group(self, group_key, moves, group=None, **kwargs):
         """
         Find existing picking for the supplied group, if none found create a new one.
         Assign the moves to the picking and return it.
+
+        The procurement group of the group key may be given if it has already been found.
         """
         ProcurementGroup = self.env["procurement.group"]
         StockPicking = self.env["stock.picking"]
@@ -96,7 +98,8 @@ class StockPicking(models.Model):
         src_loc = moves.location_id
         dest_loc = moves.location_dest_id
 
-        group = ProcurementGroup.get_or_create(group_key, create=True)
+        if group is None:
+            group = ProcurementGroup.get_or_create(group_key, create=True)
         picking_state = kwargs.get("picking_state", False)
 
         if picking_state != "done":
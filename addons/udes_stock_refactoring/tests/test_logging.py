@@ -168,3 +168,15 @@ class TestRefactorLogging(common.BaseUDES):
             with self.subTest(check=label):
                 self.assertIn(expected, log_output)
 
+
+    def test_refactor_logging_source(self):
+        """
+        Verify the refactor source is logged when given explicitly, and as unknown otherwise
+        """
+        with self.assertLogs("odoo.addons.udes_stock_refactoring.models.stock_move", level=logging.INFO) as cm:
+            self.moves._action_refactor(source="manual")
+        self.assertIn("Refactor triggered by: manual", "\n".join(cm.output))
+
+        with self.assertLogs("odoo.addons.udes_stock_refactoring.models.stock_move", level=logging.INFO) as cm:
+            self.moves.exists()._action_refactor()
+        self.assertIn("Refactor triggered by: unknown", "\n".join(cm.output))
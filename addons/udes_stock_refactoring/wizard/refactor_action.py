@@ -68,7 +68,9 @@ class RefactorStockPickingBatch(models.TransientModel):
             f"User number {str(self.env.uid)} has requested refactoring of batches {batch_ids}"
         )
         batches = Batch.browse(batch_ids)
-        res = batches.picking_ids.move_lines._action_refactor(refactor_action=self.refactor_action)
+        res = batches.picking_ids.move_lines._action_refactor(
+            refactor_action=self.refactor_action, source="do_refactor"
+        )
         batches.picking_ids.unlink_empty()
         return res
 
@@ -89,7 +91,9 @@ class RefactorStockPicking(models.TransientModel):
         )
 
         pickings = Picking.browse(picking_ids)
-        res = pickings.move_lines._action_refactor(refactor_action=self.refactor_action)
+        res = pickings.move_lines._action_refactor(
+            refactor_action=self.refactor_action, source="do_refactor"
+        )
         pickings.unlink_empty()
         return res
 
@@ -111,6 +115,6 @@ class RefactorStockMove(models.TransientModel):
 
         moves = Move.browse(move_ids)
         pickings_before_refactoring = moves.picking_id
-        res = moves._action_refactor(refactor_action=self.refactor_action)
+        res = moves._action_refactor(refactor_action=self.refactor_action, source="do_refactor")
         pickings_before_refactoring.unlink_empty()
         return res
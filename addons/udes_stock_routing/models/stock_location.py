@@ -38,3 +38,15 @@ class StockLocation(models.Model):
         "This is configurable to ensure that source -> target storage formats don't get violated by repeating the same operation type "
         "after transforming stocks storage formats.",
     )
+
+    def _get_two_stage_configuration_locations(self):
+        """
+        Map each location in self to the location its two stage configuration comes from,
+        i.e itself or its closest parent requiring two stage, or an empty recordset if none.
+        A child location can override the configuration of its parents, so the location
+        deepest in the tree wins. All locations are resolved together in a single query.
+        """
+        return self._get_nearest_ancestors(
+            [("u_requires_two_stage_when_stock_reserved", "=", True), ("active", "=", True)],
+            include_self=True,
+        )
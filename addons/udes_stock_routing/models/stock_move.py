@@ -25,13 +25,16 @@ class StockMove(models.Model):
         done_moves = self.filtered(lambda m: m.state == "done")
 
         # load all the move lines, grouped by location
-        move_lines_by_location = done_moves.move_line_ids.groupby("location_dest_id")
+        move_lines_by_location = done_moves.move_line_ids.groupby(
+            "location_dest_id", bucket=True
+        )
+        # Get the push rules that move from the locations.
+        push_steps = Push.get_paths_from_locations(done_moves.move_line_ids.location_dest_id)
 
         # Build mapping of push rule -> move lines to push
         move_lines_by_push = {}
         for location, loc_mls in move_lines_by_location:
-            # Get the push rule that moves from the location.
-            push_step = Push.get_path_from_location(location)
+            push_step = push_steps[location]
             if not push_step:
                 continue
             # If the move lines corresponding moves have any followup moves, don't apply the push rule
@@ -72,18 +75,20 @@ class StockMove(models.Model):
 
         # Group mls by move so we can preserve move information.
         mls_by_move = move_lines.groupby("move_id")
-        created_moves = Move.browse()
         base_vals = {
             "picking_type_id": push.picking_type_id.id,
             "location_id": push.location_src_id.id,
             "location_dest_id": push.location_id.id,
             "picking_id": None,
         }
+        # Build the values as copy() would for each move, but create all the moves at once.
+        vals_list = []
         for move, mls in mls_by_move:
             move_vals = base_vals.copy()
             move_vals.update(move._get_push_move_vals(mls))
-            created_moves |= move.copy(move_vals)
-        return created_moves
+            # As in copy(), so archived records in many2many fields are kept
+            vals_list.extend(move.with_context(active_test=False).copy_data(move_vals))
+        return Move.with_context(lang=None).create(vals_list)
 
     def _action_done(self, cancel_backorder=False):
         """
@@ -196,7 +201,7 @@ class StockMove(models.Model):
         # we can split those into backorders. Doing it this way prevents us from having picks with multiple
         # products (moves which cannot be _merged) backorder to several separate pickings.
         for rule, assigned_moves in moves_to_split_by_rule.items():
-            for original_picking, other_moves in assigned_moves.groupby("picking_id"):
+            for original_picking, other_moves in assigned_moves.groupby("picking_id", bucket=True):
                 res |= other_moves._split_pick_for_rule(other_moves, rule)
                 if not original_picking.move_lines:
                     original_picking.u_is_empty = True
@@ -17,7 +17,6 @@ class StockPicking(models.Model):
     def should_two_stage_initiate(self):
         """Determines if the picking in self requires two stages."""
         self.ensure_one()
-        Location = self.env["stock.location"]
         # When stock gets reserved (and has not been split already)
         if not self.u_from_two_stage_split and self.state == "assigned":
             # We trigger the split to occur if any of the stock has been reserved
@@ -25,13 +24,8 @@ class StockPicking(models.Model):
             # to avoid needing to configure two stage requirements on every individual location.
             # Individual parent configurations are retrieved later in _get_two_stage_configuration_move_line_mapping()
             from_locations = self.move_line_ids.location_id
-            two_stage_locations_incl_parents = Location.search_count(
-                [
-                    ("id", "parent_of", from_locations.ids),
-                    ("u_requires_two_stage_when_stock_reserved", "=", True),
-                ]
-            )
-            return bool(two_stage_locations_incl_parents)
+            config_locations = from_locations._get_two_stage_configuration_locations()
+            return any(config_locations.values())
         return False
 
     def _get_two_stage_configuration_move_line_mapping(self):
@@ -40,37 +34,24 @@ class StockPicking(models.Model):
         and the respective moves for each unique configuration which require two stages.
         """
         StockMoveLine = self.env["stock.move.line"]
-        Location = self.env["stock.location"]
+
+        TwoStageConfig = namedtuple(
+            "TwoStageConfig",
+            ["intermediate_location_id", "intermediate_dest_location_id", "operation_type_id"],
+        )
+        # The closest location (itself or a parent) with a two stage configuration,
+        # for all the source locations at once
+        config_locations = self.move_line_ids.location_id._get_two_stage_configuration_locations()
 
         configuration_move_line_mapping = defaultdict(StockMoveLine.browse)
         for move_line in self.move_line_ids:
-            two_stage_locations = Location.search(
-                [
-                    ("id", "parent_of", move_line.location_id.id),
-                    ("u_requires_two_stage_when_stock_reserved", "=", True),
-                ]
-            )
-            config_location = Location.browse()
-            if not two_stage_locations:
+            config_location = config_locations[move_line.location_id]
+            if not config_location:
                 # This line isn't reserved for a two stage configured location, it will be left on the original picking
                 # while the move lines with two stage configurations get ripped out into new two stage pickings.
                 continue
-            elif len(two_stage_locations) > 1:
-                # We need to determine the location deepest in the tree (itself, or closest parent) to retreieve the configuration,
-                # as it is possible to configure a child location with its own two stage configuration override.
-                # The easiest way to do this is just get the location with the most amount of parent_path nodes.
-                config_location = two_stage_locations.sorted(
-                    lambda l: -len(l.parent_path.split("/"))
-                )[0]
-            else:
-                # There is only one matching configuration, so just use it.
-                config_location = two_stage_locations
 
-            # Append this move lines to the set of move lines for this configuration set.
-            TwoStageConfig = namedtuple(
-                "TwoStageConfig",
-                ["intermediate_location_id", "intermediate_dest_location_id", "operation_type_id"],
-            )
+            # Append this move line to the set of move lines for this configuration set.
             # This mapping ends up looking something like this: {
             #   (1, 2, 1): stock.move.line(1,2,3),
             #   (1, 3, 1): stock.move.line(4),
@@ -14,18 +14,35 @@ class StockQuant(models.Model):
         Filter quants to only include full pallets/packages which can fulfill the qty from context.
         """
         StockQuant = self.env["stock.quant"]
-        filtered_quants = StockQuant.browse()
+        Package = self.env["stock.quant.package"]
+        filtered_quant_ids = []
         split_pick_qty = self._context.get("split_pick_qty", 0)
-        # Serialised products could be multiple quants for the same package.
-        seen_packages = self.env["stock.quant.package"].browse()
+        # Serialised products could be multiple quants for the same package,
+        # so group the quants by package in a single pass, keeping the order they were gathered in.
+        quants_by_package_id = {}
         for quant in quants:
-            package = quant.package_id
-            # Skip any seen packages.
-            if package in seen_packages:
-                continue
-            seen_packages |= package
-            package_quants = quants.filtered(lambda q: q.package_id == package)
-            if package_quants != package.quant_ids:
+            quants_by_package_id.setdefault(quant.package_id.id, []).append(quant)
+        # Totals of all the quants in each package, aggregated in a single query.
+        # As with package.quant_ids, empty quants are not part of the package.
+        package_totals = {
+            group["package_id"][0]: group
+            for group in StockQuant.read_group(
+                [
+                    ("package_id", "in", [x for x in quants_by_package_id if x]),
+                    "|",
+                    ("quantity", "!=", 0),
+                    ("reserved_quantity", "!=", 0),
+                ],
+                ["package_id", "quantity", "reserved_quantity"],
+                ["package_id"],
+                lazy=False,
+            )
+        }
+        for package_id, package_quants in quants_by_package_id.items():
+            package = Package.browse(package_id)
+            totals = package_totals.get(package_id)
+            # The package quants must be all the quants in the package.
+            if not totals or totals["__count"] != len(package_quants):
                 _logger.warning(
                     "Possible mixed package (%s) are not supported for whole pallet reservation strategies."
                     % package.name
@@ -33,8 +50,8 @@ class StockQuant(models.Model):
                 continue
             # Only consider the quants if their whole pallet can be reserved
             # without over-fulfilling the qty needed.
-            sum_available = sum(package_quants.mapped("available_quantity"))
-            sum_qty = sum(package_quants.mapped("quantity"))
+            sum_qty = totals["quantity"]
+            sum_available = sum_qty - totals["reserved_quantity"]
             # This pallet is part reserved somehow already.
             # Maybe manual moves? Log it and skip it, we can't use it here.
             if sum_available and sum_available != sum_qty:
@@ -49,10 +66,10 @@ class StockQuant(models.Model):
                     package.name,
                 )
                 continue
-            if sum_qty <= split_pick_qty and package:
-                filtered_quants |= quant
+            if sum_qty <= split_pick_qty:
+                filtered_quant_ids.append(package_quants[0].id)
                 split_pick_qty -= sum_qty
-        return filtered_quants
+        return StockQuant.browse(filtered_quant_ids)
 
     def _gather(self, product_id, location_id, **kwargs):
         """
@@ -1,4 +1,4 @@
-from odoo import api, fields, models
+from odoo import api, fields, models, tools
 
 RULE_RESERVATION_TYPE_WHOLE_PALLET = "whole_pallet"
 # This would require a new column and additional logic, not in scope of SE-1721.
@@ -9,6 +9,9 @@ RULE_RESERVATION_TYPES = [
     (RULE_RESERVATION_TYPE_WHOLE_PALLET, "Whole Pallet"),
 ]
 
+# Fields of stock.rule the cached push on drop rules depend on
+PUSH_ON_DROP_INDEX_FIELDS = {"u_push_on_drop", "location_src_id", "active", "sequence"}
+
 
 class StockRule(models.Model):
     _inherit = "stock.rule"
@@ -55,30 +58,87 @@ class StockRule(models.Model):
         Find a single stock.rule for which the given location is
         a valid starting location. If one not found return an empty recordset.
         Search for the stock.rules attached to the parent locations of location. If there is more than one stock.rule in the location hierarchy,
-        sort them by choosing the parent_path with the largest integer at the end of its path. This is the closest parent location to the input
-        location and hence the most relevant stock.rule.
-        Note: If there is more than one stock.rule defined on the closest location, the newest stock.rule on that location will be chosen.
+        the one attached to the closest parent location to the input location is the most relevant stock.rule.
+        Note: If there is more than one stock.rule defined on the closest location, the first one in rule order is chosen.
         """
-        Rule = self.env["stock.rule"]
-        push_steps = Rule.search(
-            [
+        return self.get_paths_from_locations(location)[location]
+
+    @api.model
+    def get_paths_from_locations(self, locations):
+        """
+        Find the push on drop stock.rule for each of the given locations, as per get_path_from_location().
+        The rules are looked up from the cached push on drop rules by source location, walking up the
+        parent_path of each location, so no queries are made for the location hierarchy.
+        Rules the current user cannot read are skipped.
+
+        :returns: a dictionary mapping each location to its stock.rule, or an empty recordset if none
+        """
+        rule_ids_by_location_id = dict(self._get_push_on_drop_rule_ids_by_location())
+        ancestor_ids_by_location = {
+            location: [
+                int(x)
+                for x in reversed((location.parent_path or "").split("/"))
+                if x and int(x) in rule_ids_by_location_id
+            ]
+            for location in locations
+        }
+        candidate_ids = {
+            rule_id
+            for ancestor_ids in ancestor_ids_by_location.values()
+            for ancestor_id in ancestor_ids
+            for rule_id in rule_ids_by_location_id[ancestor_id]
+        }
+        # The index is built as superuser, so restrict it to the rules readable here
+        readable_ids = set(self.browse(candidate_ids)._filter_access_rules("read").ids)
+        push_steps = {}
+        for location, ancestor_ids in ancestor_ids_by_location.items():
+            rule_id = next(
                 (
-                    "location_src_id",
-                    "parent_of",
-                    [
-                        location.id,
-                    ],
+                    rule_id
+                    for ancestor_id in ancestor_ids
+                    for rule_id in rule_ids_by_location_id[ancestor_id]
+                    if rule_id in readable_ids
                 ),
-                ("u_push_on_drop", "=", True),
-            ]
-        )
-        if push_steps:
-            to_order = push_steps.filtered(lambda p: p.location_src_id.parent_path)
-            ordered_steps = to_order.sorted(
-                key=lambda p: p.location_src_id.parent_path.strip("/").split("/")[-1], reverse=True
+                None,
             )
-            return ordered_steps[0] if ordered_steps else push_steps[0]
-        return self.browse()
+            push_steps[location] = self.browse(rule_id)
+        return push_steps
+
+    @api.model
+    @tools.ormcache()
+    def _get_push_on_drop_rule_ids_by_location(self):
+        """
+        Return pairs of source location id and the ids of its push on drop rules in rule order,
+        for all companies. Cached until a push on drop rule is changed.
+        """
+        Rule = self.env["stock.rule"].sudo()
+        rule_ids_by_location_id = {}
+        for rule in Rule.search([("u_push_on_drop", "=", True), ("location_src_id", "!=", False)]):
+            rule_ids_by_location_id.setdefault(rule.location_src_id.id, []).append(rule.id)
+        return tuple((x, tuple(rule_ids)) for x, rule_ids in rule_ids_by_location_id.items())
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        """Extend create to clear the cached push on drop rules"""
+        rules = super().create(vals_list)
+        if any(vals.get("u_push_on_drop") for vals in vals_list):
+            self.clear_caches()
+        return rules
+
+    def write(self, vals):
+        """Extend write to clear the cached push on drop rules"""
+        res = super().write(vals)
+        if PUSH_ON_DROP_INDEX_FIELDS.intersection(vals):
+            self.clear_caches()
+        return res
+
+    def unlink(self):
+        """Extend unlink to clear the cached push on drop rules"""
+        push_on_drop = any(self.mapped("u_push_on_drop"))
+        res = super().unlink()
+        if push_on_drop:
+            self.clear_caches()
+        return res
 
     def _run_push(self, move):
         """
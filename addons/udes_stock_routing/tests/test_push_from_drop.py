@@ -124,6 +124,33 @@ class TestGetPathFromLocation(PushFromDropBase):
         move = Push.get_path_from_location(self.received_location)
         self.assertEqual(move, self.push_putaway)
 
+    def test_paths_from_locations(self):
+        """Test that get_paths_from_locations maps each location to its path,
+        and that changes to the paths are picked up"""
+        Push = self.env["stock.rule"]
+        locations = self.received_location | self.received_damaged_location
+        paths = Push.get_paths_from_locations(locations)
+        self.assertEqual(paths[self.received_location], self.push_putaway)
+        self.assertEqual(paths[self.received_damaged_location], self.push_damaged_putaway)
+
+        # Once the damaged path stops pushing on drop, there is no path for the location
+        self.push_damaged_putaway.u_push_on_drop = False
+        paths = Push.get_paths_from_locations(locations)
+        self.assertEqual(paths[self.received_location], self.push_putaway)
+        self.assertFalse(paths[self.received_damaged_location])
+
+    def test_paths_from_locations_follow_rule_order(self):
+        """Test that the first push on drop rule in rule order is used for a location,
+        and that changes to the order are picked up"""
+        Push = self.env["stock.rule"]
+        push_damaged_qc = self.push_damaged_putaway.copy({"name": "TestDamagedQC", "sequence": 40})
+        self.assertEqual(
+            Push.get_path_from_location(self.received_damaged_location), self.push_damaged_putaway
+        )
+
+        push_damaged_qc.sequence = 20
+        self.assertEqual(Push.get_path_from_location(self.received_damaged_location), push_damaged_qc)
+
 
 class TestCreateMovesForPush(PushFromDropBase):
     """Tests for the stock.move._create_moves_for_push method in
@@ -183,6 +210,22 @@ class TestCreateMovesForPush(PushFromDropBase):
         self.assertEqual(new_apple_move.move_orig_ids, apple_move)
         self.assertEqual(new_banana_move.move_orig_ids, banana_move)
 
+    def test_moves_match_copies_of_original_moves(self):
+        """Test that created moves carry the same values as copies of the original moves"""
+        Move = self.env["stock.move"]
+
+        moves = Move._create_moves_for_push(self.push_damaged_putaway, self.move_lines)
+
+        self.assertEqual(len(moves), 2)
+        for original_move in self.goods_in.move_lines:
+            new_move = moves.filtered(lambda m: m.move_orig_ids == original_move)
+            with self.subTest(product=original_move.product_id.name):
+                self.assertEqual(new_move.name, original_move.name)
+                self.assertEqual(new_move.product_uom, original_move.product_uom)
+                self.assertEqual(new_move.company_id, original_move.company_id)
+                self.assertEqual(new_move.picking_type_id, self.push_damaged_putaway.picking_type_id)
+                self.assertFalse(new_move.picking_id)
+
 
 class TestPushFromDrop(PushFromDropBase):
     """Tests for the full push from drop functionality"""
@@ -287,6 +287,27 @@ class TestSplitPick(SplitPickBase):
         )
         self.assertEqual(len(standard_pick), 0)
 
+    def test_split_whole_pallet_rule_used_with_empty_quant_in_pallet(self):
+        """
+        Ensure that an empty quant left in a pallet does not stop the whole pallet being reserved.
+        """
+        # Set up 100 apples on a pallet in bulk, which also holds an empty quant of bananas.
+        pallet = self.create_package()
+        self.create_quant(self.apple.id, self.bulk_location_01.id, 100, package_id=pallet.id)
+        self.create_quant(self.banana.id, self.bulk_location_01.id, 0, package_id=pallet.id)
+        self.create_quant(self.apple.id, self.standard_location_01.id, 100)
+        self.procure_products([{"product": self.apple, "qty": 100}])
+        all_picks = self.Picking.search([])
+        pick_pick = all_picks.filtered(lambda p: p.picking_type_id == self.pick_operation_type)
+        pick_pick.action_assign()
+        # The whole pallet should have been split to the Bulk picking type.
+        self.assertEqual(len(pick_pick.move_lines), 0)
+        all_picks = self.Picking.search([])
+        bulk_pick = all_picks.filtered(lambda p: p.picking_type_id == self.bulk_operation_type)
+        self.assertEqual(len(bulk_pick), 1)
+        self.assertEqual(bulk_pick.move_line_ids.package_id, pallet)
+        self.assertEqual(bulk_pick.move_line_ids.product_uom_qty, 100)
+
     def test_split_whole_pallet_rule_used_for_multiple_pallets(self):
         """
         Ensure that when a rule is set up to use whole pallets, that multiple whole pallets are reserved
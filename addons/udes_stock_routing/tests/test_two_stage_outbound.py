@@ -561,3 +561,24 @@ class TestTwoStageOutbound(TwoStageOutboundBase):
         original_pick = stage_2_pick.backorder_id
         # The unfulfilled qty (9) of apples should be left on the original picking.
         self.assertEqual(len(original_pick.move_lines), 1)
+
+    def test_two_stage_configuration_locations_uses_closest_configuration(self):
+        """
+        The two stage configuration of a location comes from itself or its closest configured parent,
+        with locations outside of any configured hierarchy mapped to an empty recordset.
+        """
+        self.test_special_location_02.write(
+            {
+                "u_requires_two_stage_when_stock_reserved": True,
+                "u_two_stage_intermediate_location": self.special_staging_location.id,
+            }
+        )
+        locations = (
+            self.test_special_location_01 | self.test_special_location_02 | self.test_stock_location_01
+        )
+        config_locations = locations._get_two_stage_configuration_locations()
+        self.assertEqual(config_locations[self.test_special_location_01], self.special_location)
+        self.assertEqual(
+            config_locations[self.test_special_location_02], self.test_special_location_02
+        )
+        self.assertFalse(config_locations[self.test_stock_location_01])
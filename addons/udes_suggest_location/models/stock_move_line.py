@@ -1,5 +1,7 @@
 from odoo import models, api, _
 from odoo.exceptions import ValidationError
+from odoo.osv import expression
+from odoo.addons.udes_common.tools import profiled
 from ..registry.suggest_locations_policy import SUGGEST_LOCATION_REGISTRY
 
 NON_DROPABLE_STATES = ("cancel", "draft", "done")
@@ -29,13 +31,27 @@ class StockMoveLine(models.Model):
     def is_in_suggested_locations(self, location, picking=None, values=None):
         """
         Checking if the location is one of suggested location of the self move lines.
+
+        Rather than finding all the suggested locations, the policy and the empty
+        locations are each checked for the location with a bounded query.
         """
-        suggested_locations = self.suggest_locations(picking, values=values, limit=None)
-        if location in suggested_locations:
-            return True
-        else:
+        # As with `location in suggested_locations`, only a single location can be suggested
+        if len(location) != 1:
             return False
+        picking, policy, values = self._get_suggest_locations_policy_values(picking, values)
+        if policy.location_is_suggested(location, **values):
+            return True
+        if picking.picking_type_id.u_drop_location_constraint in WITH_EMPTY_LOCATIONS:
+            policy_domain = expression.AND(
+                [policy.get_policy_empty_location_domain(**values), [("id", "=", location.id)]]
+            )
+            empty_locations = picking.get_empty_locations(
+                limit=1, sort=False, policy_domain=policy_domain
+            )
+            return location in empty_locations
+        return False
 
+    @profiled("stock.move.line.suggest_locations")
     def suggest_locations(self, picking=None, values=None, limit=30):
         """
         Suggest locations for move line, either by self or picking_type and values
@@ -50,24 +66,11 @@ class StockMoveLine(models.Model):
         suggested, empty = self.split_suggested_locations(picking=picking, values=values, limit=limit)
         return suggested | empty
 
-
-    def split_suggested_locations(self, picking=None, values=None, include_empty_locations=True, limit=30):
+    def _get_suggest_locations_policy_values(self, picking=None, values=None):
         """
-        Suggest locations for move line, either by self or picking_type and values
-
-        - picking: {stock.picking}
-            If not set, it will be determined from the picking for the stock move line in self
-        - values: Dictionary
-            Used to determine values to use when self is an empty recordset
-        include_empty_locations: Boolean
-            If True will add suggested empty locations to the suggested locations.
-        - limit: Integer
-            If set then the location recordset returned will be less than or equal to the limit.
-
-        For performance, we can call suggested locations with or without empty locations.
-
+        Get the picking, the suggest locations policy and the values to pass to the policy,
+        either from self or from picking and values
         """
-        Location = self.env["stock.location"]
         # Validate preconditions
         if not self and (not picking or not values):
             raise ValueError(
@@ -94,6 +97,28 @@ class StockMoveLine(models.Model):
             values = policy.get_values_from_mls(self)
         else:
             values = policy.get_values_from_dict(values)
+        return picking, policy, values
+
+    def split_suggested_locations(self, picking=None, values=None, include_empty_locations=True, limit=30):
+        """
+        Suggest locations for move line, either by self or picking_type and values
+
+        - picking: {stock.picking}
+            If not set, it will be determined from the picking for the stock move line in self
+        - values: Dictionary
+            Used to determine values to use when self is an empty recordset
+        include_empty_locations: Boolean
+            If True will add suggested empty locations to the suggested locations.
+        - limit: Integer
+            If set then the location recordset returned will be less than or equal to the limit.
+
+        For performance, we can call suggested locations with or without empty locations.
+
+        """
+        Location = self.env["stock.location"]
+
+        picking, policy, values = self._get_suggest_locations_policy_values(picking, values)
+        picking_type = picking.picking_type_id
         # Get locations
         locations = policy.get_locations(**values)
         if limit:
@@ -131,7 +156,7 @@ class StockMoveLine(models.Model):
         if locations and set(locations.mapped("usage")) == VIEW_SET:
             return
         # Group mls so we can do policy dependant check
-        for picking_type, mls in drop_mls.groupby("u_picking_type_id"):
+        for picking_type, mls in drop_mls.groupby("u_picking_type_id", bucket=True):
             if not picking_type.u_suggest_locations_policy:
                 continue
 
@@ -148,13 +173,11 @@ class StockMoveLine(models.Model):
                 if set(locs.mapped("usage")) == VIEW_SET:
                     # Allow view destination locations on create
                     continue
-                # Get the suggested locations for comparison
-                suggested_locations = mls_validation_grp.suggest_locations(limit=None)
-                if not suggested_locations:
-                    raise ValidationError(_("There are no valid locations to drop stock"))
-
                 # locs should be one of the suggested locations
-                if locs not in suggested_locations:
+                if not mls_validation_grp.is_in_suggested_locations(locs):
+                    # Only look for any suggested location to tell the user why it failed
+                    if not mls_validation_grp.suggest_locations(limit=1):
+                        raise ValidationError(_("There are no valid locations to drop stock"))
                     raise ValidationError(
                         _("Drop off location must be one of the suggested locations")
                     )
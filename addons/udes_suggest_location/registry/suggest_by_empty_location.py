@@ -33,6 +33,13 @@ class ByEmptyLocation(SuggestLocationPolicy):
             "location": picking.location_dest_id,
         }
 
+    def _get_locations_domain(self, location):
+        return [
+            ("location_id", "child_of", location.id),
+            ("barcode", "!=", False),
+            ("quant_ids", "=", False),
+        ]
+
     def get_locations(self, location, **kwargs):
         """
         Search for locations which are children of the picking destination location
@@ -41,15 +48,19 @@ class ByEmptyLocation(SuggestLocationPolicy):
 
         # Add order="id" for performance as we don't care about the order
         child_locations_of_picking_destination = Location.search(
-            [
-                ("location_id", "child_of", location.id),
-                ("barcode", "!=", False),
-                ("quant_ids", "=", False),
-            ],
-            order="id",
+            self._get_locations_domain(location), order="id"
         )
         return child_locations_of_picking_destination
 
+    def location_is_suggested(self, drop_location, location, **kwargs):
+        """
+        Check the drop location is an empty child of the picking destination location
+        """
+        Location = self.env["stock.location"]
+
+        domain = self._get_locations_domain(location) + [("id", "=", drop_location.id)]
+        return bool(Location.search(domain, limit=1, order="id"))
+
     def iter_mls(self, mls):
         """
         Group by picking ID as the mls depend on picking destination location
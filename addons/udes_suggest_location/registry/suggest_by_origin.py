@@ -31,19 +31,29 @@ class ByOrigin(SuggestLocationPolicy):
             "origin": picking.origin,
         }
 
+    def _get_move_lines_domain(self, origin, location):
+        return [
+            ("picking_id.state", "=", "done"),
+            ("picking_id.origin", "=", origin),
+            ("location_dest_id", "child_of", location.id),
+        ]
+
     def get_locations(self, origin, location, **kwargs):
         """Get all locations that are the location or its child with the same origin."""
         MoveLine = self.env["stock.move.line"]
         mls_for_location = MoveLine.search(
-            [
-                ("picking_id.state", "=", "done"),
-                ("picking_id.origin", "=", origin),
-                ("location_dest_id", "child_of", location.id),
-            ],
-            order="id",
+            self._get_move_lines_domain(origin, location), order="id"
         )
         return mls_for_location.location_dest_id
 
+    def location_is_suggested(self, drop_location, origin, location, **kwargs):
+        """Check stock with the same origin has been dropped in the drop location."""
+        MoveLine = self.env["stock.move.line"]
+        domain = self._get_move_lines_domain(origin, location) + [
+            ("location_dest_id", "=", drop_location.id)
+        ]
+        return bool(MoveLine.search(domain, limit=1, order="id"))
+
     def iter_mls(self, mls):
         """Iterate over move lines grouped by origin."""
         for _origin, grouped_mls in mls.groupby(lambda ml: ml.picking_id.origin):
@@ -38,21 +38,29 @@ class ByProduct(SuggestLocationPolicy):
             "location": picking.location_dest_id,
         }
 
+    def _get_quants_domain(self, product, location):
+        return [
+            ("location_id", "child_of", location.id),
+            ("product_id", "=", product.id),
+        ]
+
     def get_locations(self, product, location, **kwargs):
         """Get all locations that are the location or child of its location with the same
         product
         """
         Quant = self.env["stock.quant"]
         # Add order="id" for performance as we don't care about the order
-        product_quants = Quant.search(
-            [
-                ("location_id", "child_of", location.id),
-                ("product_id", "=", product.id),
-            ],
-            order="id",
-        )
+        product_quants = Quant.search(self._get_quants_domain(product, location), order="id")
         return product_quants.location_id
 
+    def location_is_suggested(self, drop_location, product, location, **kwargs):
+        """Check the drop location already stores the product"""
+        Quant = self.env["stock.quant"]
+        domain = self._get_quants_domain(product, location) + [
+            ("location_id", "=", drop_location.id)
+        ]
+        return bool(Quant.search(domain, limit=1, order="id"))
+
     def iter_mls(self, mls):
         for _prod, grouped_mls in mls.groupby("product_id"):
             yield grouped_mls
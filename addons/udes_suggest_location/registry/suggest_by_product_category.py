@@ -52,6 +52,13 @@ class ByProductCategory(SuggestLocationPolicy):
         policy_domain += [("id" , "child_of" , location.id), ("id", "child_of", location_ids.ids)]
         return policy_domain
 
+    def _get_product_category_locations_domain(self, product, location, location_ids):
+        return [
+            ("location_id", "child_of", location.id),
+            ("product_id", "=", product.id),
+            ("location_id", "child_of", location_ids.ids),
+        ]
+
     def get_locations(self, product, location, location_ids, **kwargs):
         """
         Get product order point locations and all locations that are the location or child of its
@@ -61,11 +68,9 @@ class ByProductCategory(SuggestLocationPolicy):
         """
         Quant = self.env["stock.quant"]
         OrderPoint = self.env["stock.warehouse.orderpoint"]
-        product_category_locations_domain = [
-            ("location_id", "child_of", location.id),
-            ("product_id", "=", product.id),
-            ("location_id", "child_of", location_ids.ids),
-        ]
+        product_category_locations_domain = self._get_product_category_locations_domain(
+            product, location, location_ids
+        )
 
         # Add order="id" for performance as we don't care about the order
         product_orderpoints = OrderPoint.search(product_category_locations_domain, order="id")
@@ -78,6 +83,20 @@ class ByProductCategory(SuggestLocationPolicy):
         locations = orderpoint_locations | quant_locations
         return locations
 
+    def location_is_suggested(self, drop_location, product, location, location_ids, **kwargs):
+        """
+        Check the drop location has an order point or stock for the product
+        """
+        Quant = self.env["stock.quant"]
+        OrderPoint = self.env["stock.warehouse.orderpoint"]
+        domain = self._get_product_category_locations_domain(product, location, location_ids) + [
+            ("location_id", "=", drop_location.id)
+        ]
+        return bool(
+            OrderPoint.search(domain, limit=1, order="id")
+            or Quant.search(domain, limit=1, order="id")
+        )
+
     def iter_mls(self, mls):
         for _prod, grouped_mls in mls.groupby("product_id"):
             yield grouped_mls
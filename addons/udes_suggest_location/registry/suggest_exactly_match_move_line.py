@@ -45,6 +45,13 @@ class ExactlyMatchMoveLine(SuggestLocationPolicy):
             return StockLocation.browse()
         return location
 
+    def location_is_suggested(self, drop_location, location, **kwargs):
+        """
+        Check the drop location is the non-view location destination of the move line
+        """
+        location.ensure_one()
+        return location.usage != "view" and drop_location == location
+
     def iter_mls(self, mls):
         """
         Group by the moveline location destination
@@ -37,6 +37,14 @@ class SuggestLocationPolicy(metaclass=SuggestRegistryMeta):
         Location = self.env["stock.location"]
         return Location.browse()
 
+    def location_is_suggested(self, drop_location, **values):
+        """Check whether drop_location is one of the locations found by get_locations
+
+        Policies should override this with a bounded existence check, as this
+        default falls back to finding all the locations.
+        """
+        return drop_location in self.get_locations(**values)
+
     @abstractmethod
     def iter_mls(self, mls):
         """Iterator so sensibly group mls for the policy"""
@@ -240,6 +240,31 @@ class ByProductTestCase(common.SuggestedLocations):
             locs = self.MoveLine.suggest_locations(picking=self.picking_pick, values=values)
             self.assertEqual(locs, self.pick_all_locs)
 
+    def test_is_in_suggested_locations_by_product(self):
+        """Check locations are found in the suggested locations without searching for them
+        all, looping through the drop location constraints with and without empty locations
+        """
+        locations = self.pick_all_locs | self.test_check_location_02 | self.test_stock_location_01
+        for drop_constraint in ("enforce", "enforce_with_empty"):
+            self.picking_type_pick.u_drop_location_constraint = drop_constraint
+            suggested_locations = self.apple_mls.suggest_locations(limit=None)
+            for location in locations:
+                with self.subTest(drop_constraint=drop_constraint, location=location.name):
+                    self.assertEqual(
+                        self.apple_mls.is_in_suggested_locations(location),
+                        location in suggested_locations,
+                    )
+        self.assertTrue(
+            self.ByProduct.location_is_suggested(
+                self.test_check_location_01, product=self.apple, location=self.check_location
+            )
+        )
+        self.assertFalse(
+            self.ByProduct.location_is_suggested(
+                self.test_check_location_02, product=self.apple, location=self.check_location
+            )
+        )
+
     def test_validation_of_locations_by_product_enforced(self):
         """Check the validation policy for enforced with product policy"""
         # Check suggested locations for each product are correct